@@ -7,7 +7,7 @@ with support for loading from files, environment variables,
 and merging configurations from different sources.
 """
 
-from quackcore.config.loader import load_config, merge_configs
+from quackcore.config.loader import load_config, load_config_lazy, merge_configs
 from quackcore.config.models import (
     GeneralConfig,
     GoogleConfig,
@@ -18,6 +18,7 @@ from quackcore.config.models import (
     PluginsConfig,
     QuackConfig,
 )
+from quackcore.config.protocols import QuackConfigProtocol
 from quackcore.config.utils import (
     get_config_value,
     get_env,
@@ -39,8 +40,11 @@ __all__ = [
     "GoogleConfig",
     "NotionConfig",
     "PluginsConfig",
+    # Protocols
+    "QuackConfigProtocol",
     # Functions
     "load_config",
+    "load_config_lazy",
     "merge_configs",
     "get_env",
     "load_env_config",
@@ -6,19 +6,26 @@ This module provides utilities for loading and merging configurations
 from various sources, with support for environment-specific overrides.
 """
 
+import copy
+import hashlib
+import json
 import os
+import re
+import sys
+import threading
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, cast
 
 import yaml
 
 from quackcore.config.models import QuackConfig
+from quackcore.config.protocols import QuackConfigProtocol
 from quackcore.errors import QuackConfigurationError, wrap_io_errors
 from quackcore.logging import get_logger
 from quackcore.paths import resolver
 
-T = TypeVar("T")  # Generic type for flexible typing
-
 # Default configuration values to be merged when merge_defaults is True.
 DEFAULT_CONFIG_VALUES: dict[str, Any] = {
     "logging": {
@@ -44,15 +51,214 @@ DEFAULT_CONFIG_LOCATIONS = [
 ]
 
 ENV_PREFIX = "QUACK_"
+_PREFIX_LEN = len(ENV_PREFIX)
+
+# ${VAR} references expanded in YAML string values.
+_ENV_VAR_PATTERN = re.compile(r"\$\{([A-Z_][A-Z0-9_]*)\}")
+
+# Case-insensitive boolean spellings recognized in environment variables.
+_BOOL_VALUES = {"true": True, "false": False}
+
+# Characters of number spellings the single-pass scan in _convert_env_value
+# does not handle (exponents, explicit signs, digit separators).
+_NUMBER_FALLBACK_CHARS = frozenset("eE+_")
+
+# Maximum number of loaded configurations kept in the cache.
+CONFIG_CACHE_SIZE = 32
+
+# Loaded configurations keyed on the file key from _file_key (real path,
+# device, inode, mtime_ns, size), merge_env, merge_defaults and a QUACK_*
+# environment fingerprint.
+_CONFIG_CACHE: dict[tuple[Any, ...], QuackConfig] = {}
+
+# Validated configurations keyed on a digest of the merged dictionary they
+# were built from.
+_VALIDATED_CACHE: dict[bytes, QuackConfig] = {}
+
+# Environment variable that enables file watching for configuration caching.
+CONFIG_WATCH_ENV = "QUACK_CONFIG_WATCH"
+
+# Absolute paths of the configuration files watched for changes. Watched
+# files skip the mtime check.
+_WATCHED_FILES: set[str] = set()
+
+# Watchdog event types that mean a watched file's contents may have changed.
+# Others, such as the opened and closed events of the loader's own reads,
+# are ignored.
+_CONFIG_CHANGE_EVENTS = frozenset({"modified", "created", "moved", "deleted"})
+
+# Incremented on every cache invalidation and part of each load_config cache
+# key, so a load that was running during an invalidation stores its result
+# under a key no later load uses.
+_CACHE_GENERATION = 0
+
+# Configuration files found by find_config_file, keyed on (QUACK_CONFIG,
+# working directory, $HOME). Only hits are stored, so a search that found
+# nothing is repeated and picks up files created since.
+_FOUND_CONFIG_FILES: dict[tuple[str | None, str, str | None], str] = {}
+
+# Maximum number of find_config_file results kept in the cache.
+_FOUND_CONFIG_FILES_SIZE = 8
+
+# Running watchdog observers keyed on the directory they watch.
+_CONFIG_OBSERVERS: dict[str, Any] = {}
+
+# Guards the configuration caches and the watcher state, which the watchdog
+# thread modifies when a watched file changes.
+_CACHE_LOCK = threading.Lock()
+
+# Parsed environment configuration keyed on the QUACK_* variable snapshot it
+# was built from. Holds at most one entry.
+_ENV_CONFIG_CACHE: dict[tuple[tuple[str, str], ...], dict[str, Any]] = {}
 
 logger = get_logger(__name__)
 
+# Prefer the libyaml-backed loader, which parses several times faster.
+_YamlLoader: type[yaml.SafeLoader | yaml.CSafeLoader]
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
+    logger.debug(
+        "libyaml is not available, falling back to the pure-Python YAML loader; "
+        "install libyaml for faster configuration loading"
+    )
+
+
+def _intern_keys[T](data: T) -> T:
+    """
+    Intern all string dictionary keys in a parsed configuration, in place.
+
+    Interned keys let dictionary lookups against the identifier-like keys
+    used in code (which CPython interns already) succeed on identity.
+
+    Args:
+        data: Parsed configuration data
+
+    Returns:
+        The same data, with its dictionary keys interned
+    """
+    if isinstance(data, dict):
+        items = list(data.items())
+        data.clear()
+        for key, value in items:
+            if isinstance(key, str):
+                key = sys.intern(key)
+            data[key] = _intern_keys(value)
+    elif isinstance(data, list):
+        for item in data:
+            _intern_keys(item)
+    return data
+
+
+def _file_key(path: str | Path) -> tuple[str, int, int, int, int]:
+    """
+    Identify a file and its current version for use in cache keys.
+
+    The real path keeps files reached through the same relative path from
+    different working directories apart; the device and inode numbers do the
+    same for files whose mtime and size match, as after cp -p or in builds
+    that normalize mtimes.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Tuple of the real path, device, inode, mtime in nanoseconds and size
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    real_path = os.path.realpath(path)
+    stat = os.stat(real_path)
+    return (real_path, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def _load_yaml_cached(
+    path: str, dev: int, ino: int, mtime_ns: int, size: int
+) -> dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its identity and modification stamp.
+
+    All arguments but the path are only part of the cache key, so that a
+    modified or replaced file is parsed again.
+
+    Args:
+        path: Real path to YAML file
+        dev: Device number of the file
+        ino: Inode number of the file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Dictionary with configuration values
+    """
+    with open(path) as file:
+        content = file.read()
+    config = yaml.load(content, Loader=_YamlLoader)  # noqa: S506
+    return _intern_keys(config) if config else {}
+
+
+def _expand_value(value: str) -> str:
+    """
+    Expand ${VAR} references and a leading ~ in a configuration string.
+
+    Unset variables are left as written.
+
+    Args:
+        value: String value from a configuration file
+
+    Returns:
+        The expanded string
+    """
+    if "$" in value:
+        environ = os.environ
+        value = _ENV_VAR_PATTERN.sub(
+            lambda match: environ.get(match.group(1), match.group(0)), value
+        )
+    if value.startswith("~"):
+        value = os.path.expanduser(value)
+    return value
+
+
+def _expand_env_vars(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Expand environment references in all string values of a config, in place.
+
+    Args:
+        data: Parsed configuration data
+
+    Returns:
+        The same dictionary, with its string values expanded
+    """
+    stack: list[dict[Any, Any] | list[Any]] = [data]
+    while stack:
+        container = stack.pop()
+        items: Iterable[tuple[Any, Any]] = (
+            container.items() if isinstance(container, dict) else enumerate(container)
+        )
+        for key, value in items:
+            if isinstance(value, str):
+                if "$" in value or value.startswith("~"):
+                    container[key] = _expand_value(value)
+            elif isinstance(value, dict | list):
+                stack.append(value)
+    return data
+
 
 @wrap_io_errors
 def load_yaml_config(path: str | Path) -> dict[str, Any]:
     """
     Load a YAML configuration file.
 
+    Parsed files are cached per real path until the file is replaced or its
+    modification time or size changes.
+    Each call returns a fresh copy, so callers may mutate the result.
+    ${VAR} references and a leading ~ in string values are expanded in that
+    copy, so consumers never need to expand paths themselves.
+
     Args:
         path: Path to YAML file
 
@@ -63,17 +269,138 @@ def load_yaml_config(path: str | Path) -> dict[str, Any]:
         QuackConfigurationError: If the file cannot be loaded
     """
     try:
-        with open(Path(path)) as file:
-            config = yaml.safe_load(file)
-        return config or {}
+        config = _load_yaml_cached(*_file_key(path))
+        return _expand_env_vars(copy.deepcopy(config))
     except (yaml.YAMLError, OSError) as e:
         raise QuackConfigurationError(f"Failed to load YAML config: {e}", path) from e
 
 
+def clear_config_cache() -> None:
+    """
+    Clear the cached YAML files and loaded configurations.
+
+    Useful in tests or after changing configuration in ways the cache
+    cannot detect, such as a file rewritten within the same mtime tick.
+    """
+    global _CACHE_GENERATION
+    with _CACHE_LOCK:
+        _CACHE_GENERATION += 1
+        _CONFIG_CACHE.clear()
+        _VALIDATED_CACHE.clear()
+        _ENV_CONFIG_CACHE.clear()
+        _FOUND_CONFIG_FILES.clear()
+    _load_yaml_cached.cache_clear()
+
+
+def _env_snapshot() -> tuple[tuple[str, str], ...]:
+    """
+    Take a sorted snapshot of the QUACK_* environment variables.
+
+    Returns:
+        Tuple of (name, value) pairs for every variable with the QUACK_ prefix
+    """
+    return tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key.startswith(ENV_PREFIX)
+        )
+    )
+
+
+def _env_fingerprint() -> int:
+    """
+    Compute a cheap fingerprint of the QUACK_* environment variables.
+
+    Returns:
+        Hash that changes whenever a QUACK_* variable is added, removed or changed
+    """
+    return hash(_env_snapshot())
+
+
+def _cache_put[K](cache: dict[K, QuackConfig], key: K, config: QuackConfig) -> None:
+    """
+    Store a configuration in a bounded cache, evicting the oldest entry.
+
+    Args:
+        cache: Cache to store the configuration in
+        key: Cache key
+        config: Configuration to store
+    """
+    with _CACHE_LOCK:
+        if len(cache) >= CONFIG_CACHE_SIZE:
+            # Dicts preserve insertion order, so the first key is the oldest
+            cache.pop(next(iter(cache)), None)
+        cache[key] = config
+
+
+def _validate_config(config_dict: dict[str, Any]) -> QuackConfig:
+    """
+    Validate a merged configuration dictionary, reusing earlier results.
+
+    Different inputs (for example an unrelated QUACK_* variable changing)
+    often merge into the same dictionary, so validated configurations are
+    cached on a BLAKE2b digest of its canonical JSON form.
+
+    Args:
+        config_dict: Merged configuration dictionary
+
+    Returns:
+        QuackConfig: Validated configuration
+    """
+    try:
+        # repr() keeps non-JSON values distinct from strings with the same text
+        serialized = json.dumps(config_dict, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        # Mixed key types cannot be sorted; validate without caching
+        return QuackConfig.model_validate(config_dict)
+
+    digest = hashlib.blake2b(serialized.encode(), digest_size=16).digest()
+    if (cached := _VALIDATED_CACHE.get(digest)) is not None:
+        return cached
+
+    config = QuackConfig.model_validate(config_dict)
+    _cache_put(_VALIDATED_CACHE, digest, config)
+    return config
+
+
+def _config_cache_key(
+    file_path: Path | None, merge_env: bool, merge_defaults: bool
+) -> tuple[Any, ...] | None:
+    """
+    Build the cache key for a load_config call.
+
+    Args:
+        file_path: Resolved configuration file, or None if none was found
+        merge_env: Whether environment variables are merged
+        merge_defaults: Whether default values are merged
+
+    Returns:
+        Cache key, or None if the file cannot be stat'ed and must not be cached
+    """
+    # Read first, so an invalidation during the load makes this key stale
+    generation = _CACHE_GENERATION
+    if file_path is None:
+        file_key: tuple[Any, ...] = (None,)
+    elif (abs_path := os.path.abspath(file_path)) in _WATCHED_FILES:
+        # The watcher clears the cache and unwatches the file on any change
+        file_key = (abs_path,)
+    else:
+        try:
+            file_key = _file_key(file_path)
+        except OSError:
+            return None
+    return (*file_key, merge_env, merge_defaults, _env_fingerprint(), generation)
+
+
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """
     Deep merge two dictionaries.
 
+    The merge walks nested dictionaries with an explicit stack instead of
+    recursion. Only dictionaries present in both inputs are copied, so
+    neither input is modified.
+
     Args:
         base: Base dictionary
         override: Override dictionary
@@ -82,59 +409,83 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
         Merged dictionary
     """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    if not override:
+        return result
+
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                # Copy the base-owned sub-dictionary before merging into it
+                current = dst[key] = current.copy()
+                stack.append((current, value))
+            else:
+                dst[key] = value
     return result
 
 
-def _is_float(value: str) -> bool:
+def _parse_number(value: str) -> int | float | str:
     """
-    Check if the string represents a float number.
+    Parse a number spelling not covered by the fast scan in _convert_env_value.
 
     Args:
-        value: The string to check.
+        value: The environment variable value as string.
 
     Returns:
-        True if the string can be interpreted as a float, False otherwise.
+        The value as int or float, or unchanged if it is not a number.
     """
-    try:
-        float(value)
-        # Must have a decimal point with at least one digit after it
-        return "." in value and not value.endswith(".")
-    except ValueError:
-        return False
+    if _NUMBER_FALLBACK_CHARS.isdisjoint(value):
+        return value
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
 
 
 def _convert_env_value(value: str) -> bool | int | float | str:
     """
     Convert an environment variable string value to an appropriate type.
 
+    Common numbers are recognized with a single scan over the string:
+    integers are an optional minus sign followed by ASCII digits; floats
+    additionally contain one decimal point followed by at least one digit.
+    Values the scan rejects that contain e, E, + or _ (such as 1e-3, +5 or
+    1_000) are still tried with int() and float() before being kept as
+    strings.
+
     Args:
         value: The environment variable value as string.
 
     Returns:
         The value converted to bool, int, float, or left as string.
     """
-    v_lower = value.lower()
-    if v_lower == "true":
-        return True
-    if v_lower == "false":
-        return False
-
-    # Convert negative integers (handle the minus sign)
-    if value.startswith("-") and value[1:].isdigit():
+    if len(value) in (4, 5):
+        flag = _BOOL_VALUES.get(value.lower())
+        if flag is not None:
+            return flag
+
+    has_digit = False
+    dot_index = -1
+    for index, char in enumerate(value):
+        if "0" <= char <= "9":
+            has_digit = True
+        elif char == "." and dot_index < 0:
+            dot_index = index
+        elif char != "-" or index != 0:
+            return _parse_number(value)
+
+    if not has_digit:
+        return value
+    if dot_index < 0:
         return int(value)
-    # Convert positive integers
-    if value.isdigit():
-        return int(value)
-    # Convert floats
-    if _is_float(value):
-        return float(value)
-
-    return value
+    # Must have at least one digit after the decimal point
+    if dot_index == len(value) - 1:
+        return value
+    return float(value)
 
 
 def _get_env_config() -> dict[str, Any]:
@@ -145,58 +496,275 @@ def _get_env_config() -> dict[str, Any]:
     QUACK_SECTION__KEY=value
     where SECTION is the configuration section and KEY is the key within that section.
 
+    The parsed result is cached until the QUACK_* variables change, so the
+    returned dictionary is shared and must not be modified.
+
     Returns:
         Dictionary with configuration values
     """
+    snapshot = _env_snapshot()
+    if (cached := _ENV_CONFIG_CACHE.get(snapshot)) is not None:
+        return cached
+
     config: dict[str, Any] = {}
-    for key, value in os.environ.items():
-        if key.startswith(ENV_PREFIX):
-            key_parts = key[len(ENV_PREFIX) :].lower().split("__")
-            if len(key_parts) < 2:
-                continue
-            typed_value = _convert_env_value(value)
-            current = config
-            for i, part in enumerate(key_parts):
-                if i == len(key_parts) - 1:
-                    current[part] = typed_value
-                else:
-                    current.setdefault(part, {})
-                    current = current[part]
+    for key, value in snapshot:
+        section, sep, rest = key[_PREFIX_LEN:].lower().partition("__")
+        if not sep:
+            # Keys without a section are not configuration values
+            continue
+        current = config.setdefault(sys.intern(section), {})
+        if "__" in rest:
+            *parents, rest = rest.split("__")
+            for part in parents:
+                current = current.setdefault(sys.intern(part), {})
+        current[sys.intern(rest)] = _convert_env_value(value)
+
+    _ENV_CONFIG_CACHE.clear()
+    _ENV_CONFIG_CACHE[snapshot] = config
     return config
 
 
-def find_config_file() -> Path | None:
+def _path_exists(path: str | Path) -> bool:
     """
-    Find a configuration file in standard locations.
+    Check whether a path exists with a single stat call.
+
+    Args:
+        path: Path to check
 
     Returns:
-        Path to the configuration file if found, None otherwise
+        True if the path exists, False otherwise
     """
-    # Check environment variable first
-    if config_path := os.environ.get("QUACK_CONFIG"):
-        path = Path(config_path).expanduser()
-        if path.exists():
+    try:
+        os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _first_existing(candidates: Sequence[Path]) -> Path | None:
+    """
+    Return the first candidate path that exists.
+
+    Args:
+        candidates: Paths to check, in order of preference
+
+    Returns:
+        The first existing path, or None if none exist
+    """
+    for path in candidates:
+        if _path_exists(path):
             return path
+    return None
+
+
+@lru_cache(maxsize=4)
+def _resolve_default_locations(
+    locations: tuple[str, ...], home: str | None
+) -> tuple[Path, ...]:
+    """
+    Expand the default configuration locations into Path objects.
+
+    Args:
+        locations: Default locations, possibly starting with "~"
+        home: Value of $HOME, only used as part of the cache key
+
+    Returns:
+        Tuple of expanded paths in search order
+    """
+    return tuple(Path(location).expanduser() for location in locations)
+
+
+def _search_config_file(quack_config: str | None, home: str | None) -> str | None:
+    """
+    Search the standard locations for a configuration file.
+
+    Args:
+        quack_config: Value of the QUACK_CONFIG environment variable
+        home: Value of $HOME, which determines how "~" locations expand
+
+    Returns:
+        Path to the configuration file as a string if found, None otherwise
+    """
+    # Check environment variable first
+    if quack_config:
+        env_path = Path(quack_config).expanduser()
+        if _path_exists(env_path):
+            return str(env_path)
 
     # Check default locations
-    for location in DEFAULT_CONFIG_LOCATIONS:
-        path = Path(location).expanduser()
-        if path.exists():
-            return path
+    locations = _resolve_default_locations(tuple(DEFAULT_CONFIG_LOCATIONS), home)
+    if default_path := _first_existing(locations):
+        return str(default_path)
 
     # Try to find project root and check for config there
     try:
         root = resolver.get_project_root()
-        for name in ["quack_config.yaml", "config/quack_config.yaml"]:
-            path = root / name
-            if path.exists():
-                return path
+        candidates = [root / "quack_config.yaml", root / "config/quack_config.yaml"]
+        if root_path := _first_existing(candidates):
+            return str(root_path)
     except Exception as e:
         logger.debug("Failed to find project root: %s", e)
 
     return None
 
 
+def _on_config_file_event(event_type: str, paths: set[str]) -> None:
+    """
+    Invalidate cached configuration after a watched file changed.
+
+    Changed files are also unwatched, so the next load checks them again
+    before watching them anew. Clearing the cache starts a new cache
+    generation, so a load that was running during the change cannot store
+    its result where later loads would find it.
+
+    Args:
+        event_type: Watchdog event type, such as "modified" or "opened"
+        paths: Absolute paths reported by the file system event
+    """
+    if event_type not in _CONFIG_CHANGE_EVENTS:
+        return
+    with _CACHE_LOCK:
+        changed = sorted(_WATCHED_FILES & paths)
+        _WATCHED_FILES.difference_update(changed)
+    if not changed:
+        return
+    logger.debug("Configuration file changed, clearing cache: %s", changed)
+    clear_config_cache()
+
+
+def _watch_config_file(file_path: Path) -> bool:
+    """
+    Watch a configuration file for changes if QUACK_CONFIG_WATCH=1 is set.
+
+    Requires the optional watchdog package; without it, caching keeps
+    relying on mtime checks.
+
+    Args:
+        file_path: Configuration file to watch
+
+    Returns:
+        True if the file is being watched, False otherwise
+    """
+    abs_path = os.path.abspath(file_path)
+    if abs_path in _WATCHED_FILES:
+        return True
+    if os.environ.get(CONFIG_WATCH_ENV) != "1":
+        return False
+
+    try:
+        from watchdog.events import FileSystemEvent, FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        logger.debug("watchdog is not installed, config changes use mtime checks")
+        return False
+
+    class _ConfigFileHandler(FileSystemEventHandler):
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            paths = {os.fsdecode(event.src_path), os.fsdecode(event.dest_path)}
+            _on_config_file_event(event.event_type, paths)
+
+    directory = os.path.dirname(abs_path)
+    with _CACHE_LOCK:
+        if directory not in _CONFIG_OBSERVERS:
+            try:
+                observer = Observer()
+                observer.schedule(_ConfigFileHandler(), directory, recursive=False)
+                observer.daemon = True
+                observer.start()
+            except Exception as e:
+                logger.debug("Failed to watch config directory %s: %s", directory, e)
+                return False
+            _CONFIG_OBSERVERS[directory] = observer
+
+        _WATCHED_FILES.add(abs_path)
+    return True
+
+
+def _stop_config_watchers() -> None:
+    """Stop all configuration file watchers and forget the watched files."""
+    with _CACHE_LOCK:
+        _WATCHED_FILES.clear()
+        observers = list(_CONFIG_OBSERVERS.values())
+        _CONFIG_OBSERVERS.clear()
+    # Join outside the lock, since a pending event handler may be waiting on it
+    for observer in observers:
+        observer.stop()
+    for observer in observers:
+        observer.join()
+
+
+def find_config_file() -> Path | None:
+    """
+    Find a configuration file in standard locations.
+
+    A found file is cached per QUACK_CONFIG value, working directory and
+    home directory, and searched for again once it no longer exists. Misses
+    are not cached. Call find_config_file.cache_clear() to pick up a file
+    created in a location that is searched before the cached one.
+
+    Returns:
+        Path to the configuration file if found, None otherwise
+    """
+    try:
+        cwd = os.getcwd()
+    except OSError:
+        cwd = ""
+    quack_config = os.environ.get("QUACK_CONFIG")
+    home = os.environ.get("HOME")
+
+    key = (quack_config, cwd, home)
+    found = _FOUND_CONFIG_FILES.get(key)
+    if found is not None and _path_exists(found):
+        return Path(found)
+
+    found = _search_config_file(quack_config, home)
+    with _CACHE_LOCK:
+        if found is None:
+            _FOUND_CONFIG_FILES.pop(key, None)
+            return None
+        if len(_FOUND_CONFIG_FILES) >= _FOUND_CONFIG_FILES_SIZE:
+            _FOUND_CONFIG_FILES.pop(next(iter(_FOUND_CONFIG_FILES)), None)
+        _FOUND_CONFIG_FILES[key] = found
+    return Path(found)
+
+
+# Expose the cache reset on the public function, e.g. for tests
+find_config_file.cache_clear = _FOUND_CONFIG_FILES.clear  # type: ignore[attr-defined]
+
+
+def _resolve_config_file(config_path: str | Path | None) -> Path | None:
+    """
+    Resolve the configuration file to load and start watching it if enabled.
+
+    Args:
+        config_path: Explicit path to a configuration file, or None to search
+            the standard locations
+
+    Returns:
+        Path to the configuration file, or None if none was found
+
+    Raises:
+        QuackConfigurationError: If an explicit configuration file does not exist
+    """
+    file_path: Path | None
+    if config_path:
+        file_path = Path(config_path).expanduser()
+        # Watched files are known to exist until the watcher reports a change
+        if (
+            os.path.abspath(file_path) not in _WATCHED_FILES
+            and not file_path.exists()
+        ):
+            raise QuackConfigurationError(
+                f"Configuration file not found: {file_path}", file_path
+            )
+    else:
+        file_path = find_config_file()
+
+    if file_path:
+        _watch_config_file(file_path)
+    return file_path
+
+
 def load_config(
     config_path: str | Path | None = None,
     merge_env: bool = True,
@@ -205,6 +773,14 @@ def load_config(
     """
     Load configuration from a file and merge with environment variables and defaults.
 
+    Results are cached until the configuration file or the QUACK_* environment
+    variables change. Every call returns its own copy of the cached
+    QuackConfig, so callers may modify it freely.
+    Changes are detected from the file's mtime, or with QUACK_CONFIG_WATCH=1
+    and watchdog installed, by watching the file so cache hits skip the stat.
+    Variables referenced as ${VAR} in the file are read when it is loaded;
+    call clear_config_cache after changing them.
+
     Args:
         config_path: Path to configuration file (optional)
         merge_env: Whether to merge with environment variables
@@ -217,32 +793,130 @@ def load_config(
         QuackConfigurationError: If no configuration could be loaded
     """
     config_dict: dict[str, Any] = {}
+    file_path = _resolve_config_file(config_path)
 
-    # Load configuration from file if specified
-    if config_path:
-        file_path = Path(config_path).expanduser()
-        if not file_path.exists():
-            raise QuackConfigurationError(
-                f"Configuration file not found: {file_path}", file_path
-            )
+    cache_key = _config_cache_key(file_path, merge_env, merge_defaults)
+    if cache_key is not None:
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+    if file_path:
         config_dict = load_yaml_config(file_path)
-    else:
-        # Try to find a configuration file in standard locations
-        if file_path := find_config_file():
-            config_dict = load_yaml_config(file_path)
 
-    # Merge with environment variables if requested
+    # Merge with environment variables if requested; most runs set none
     if merge_env:
         env_config = _get_env_config()
-        config_dict = _deep_merge(config_dict, env_config)
+        if env_config:
+            config_dict = _deep_merge(config_dict, env_config)
 
-    # Merge with default configuration values if requested
+    # Merge with default configuration values if requested. Validation never
+    # modifies its input, so the defaults can be passed as-is when empty.
     if merge_defaults:
-        config_dict = _deep_merge(DEFAULT_CONFIG_VALUES, config_dict)
+        config_dict = (
+            _deep_merge(DEFAULT_CONFIG_VALUES, config_dict)
+            if config_dict
+            else DEFAULT_CONFIG_VALUES
+        )
 
     # Create configuration object from merged dictionary
-    config = QuackConfig.model_validate(config_dict)
-    return config
+    config = _validate_config(config_dict)
+
+    if cache_key is not None:
+        _cache_put(_CONFIG_CACHE, cache_key, config)
+    return config.model_copy(deep=True)
+
+
+class LazyQuackConfig:
+    """
+    Configuration proxy that defers loading until first attribute access.
+
+    The first attribute lookup calls load_config with the stored arguments and
+    every access, including assignment, is then delegated to the loaded
+    QuackConfig. Loading errors are therefore raised on first use rather than
+    at construction.
+    """
+
+    __slots__ = ("_config", "_config_path", "_merge_env", "_merge_defaults")
+
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        merge_env: bool = True,
+        merge_defaults: bool = True,
+    ) -> None:
+        """
+        Initialize the proxy without loading anything.
+
+        Args:
+            config_path: Path to configuration file (optional)
+            merge_env: Whether to merge with environment variables
+            merge_defaults: Whether to merge with default configuration values
+        """
+        self._config: QuackConfig | None = None
+        self._config_path = config_path
+        self._merge_env = merge_env
+        self._merge_defaults = merge_defaults
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying configuration has been loaded."""
+        return self._config is not None
+
+    def materialize(self) -> QuackConfig:
+        """
+        Load the configuration if needed and return it.
+
+        Returns:
+            QuackConfig: The loaded configuration
+        """
+        if self._config is None:
+            self._config = load_config(
+                self._config_path, self._merge_env, self._merge_defaults
+            )
+        return self._config
+
+    def __getattr__(self, name: str) -> object:
+        # Slots that are not initialized (e.g. on a bare copy) must not recurse
+        if name in LazyQuackConfig.__slots__:
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # The proxy's own slots are set directly; everything else is config
+        if name in LazyQuackConfig.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.materialize(), name, value)
+
+    def __repr__(self) -> str:
+        if self._config is None:
+            return f"{type(self).__name__}(config_path={self._config_path!r})"
+        return repr(self._config)
+
+
+def load_config_lazy(
+    config_path: str | Path | None = None,
+    merge_env: bool = True,
+    merge_defaults: bool = True,
+) -> QuackConfigProtocol:
+    """
+    Create a configuration that is only loaded when first used.
+
+    Useful for tools that may never touch configuration, as it keeps
+    YAML parsing and validation out of their startup path.
+
+    Args:
+        config_path: Path to configuration file (optional)
+        merge_env: Whether to merge with environment variables
+        merge_defaults: Whether to merge with default configuration values
+
+    Returns:
+        QuackConfigProtocol: Lazily loaded configuration proxy
+    """
+    return cast(
+        QuackConfigProtocol, LazyQuackConfig(config_path, merge_env, merge_defaults)
+    )
 
 
 def merge_configs(base: QuackConfig, override: dict[str, Any]) -> QuackConfig:
@@ -189,7 +189,7 @@ class QuackConfig(BaseModel):
             return False
         return True
 
-    def get_custom(self, key: str, default: T = None) -> T:
+    def get_custom(self, key: str, default: T | None = None) -> T | None:
         """
         Get a custom configuration value.
 
@@ -0,0 +1,73 @@
+# src/quackcore/config/protocols.py
+"""
+Configuration protocols for QuackCore.
+
+This module defines the Protocol interface describing the public surface of
+QuackConfig, so that lazily loaded configuration proxies can be typed.
+"""
+
+from typing import Any, Protocol, TypeVar
+
+from quackcore.config.models import (
+    GeneralConfig,
+    IntegrationsConfig,
+    LoggingConfig,
+    PathsConfig,
+    PluginsConfig,
+)
+
+T = TypeVar("T")  # Generic type for flexible typing
+
+
+class QuackConfigProtocol(Protocol):
+    """
+    Protocol for objects exposing the QuackConfig interface.
+
+    Intended for static type checking only: proxies delegate attributes
+    dynamically, which runtime protocol checks do not see.
+    """
+
+    general: GeneralConfig
+    paths: PathsConfig
+    logging: LoggingConfig
+    integrations: IntegrationsConfig
+    plugins: PluginsConfig
+    custom: dict[str, Any]
+
+    def setup_logging(self) -> None:
+        """Set up logging based on configuration."""
+        ...
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the configuration to a dictionary.
+
+        Returns:
+            dict[str, Any]: Dictionary representation of the configuration
+        """
+        ...
+
+    def get_plugin_enabled(self, plugin_name: str) -> bool:
+        """
+        Check if a plugin is enabled.
+
+        Args:
+            plugin_name: Name of the plugin
+
+        Returns:
+            bool: True if the plugin is enabled
+        """
+        ...
+
+    def get_custom(self, key: str, default: T | None = None) -> T | None:
+        """
+        Get a custom configuration value.
+
+        Args:
+            key: The configuration key
+            default: Default value if the key doesn't exist
+
+        Returns:
+            The configuration value
+        """
+        ...
@@ -3,7 +3,11 @@
 Utility functions for safe file operations (copy, move, delete).
 """
 
+import errno
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from quackcore.errors import (
@@ -21,9 +25,215 @@ from .file_ops import ensure_directory
 # Initialize module logger
 logger = get_logger(__name__)
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Linux ioctl request that clones a file's extents (a copy-on-write reflink)
+_FICLONE = 0x40049409
+
+# Bytes requested per copy_file_range call; the copy loops until end of file
+_COPY_CHUNK_SIZE = 1 << 30
+
+# Directories with more top-level entries than this are copied in parallel
+_PARALLEL_COPY_MIN_ENTRIES = 32
+
+
+def _stat_or_none(path: str | Path) -> os.stat_result | None:
+    """
+    Stat a path, returning None instead of raising if it does not exist.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        The stat result, or None if the path does not exist
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _copy_file_contents(src: str, dst: str) -> None:
+    """
+    Copy file contents inside the kernel, cloning them when possible.
+
+    Tries a FICLONE reflink first, which is O(1) on copy-on-write
+    filesystems such as btrfs or XFS, then os.copy_file_range.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Raises:
+        OSError: If neither mechanism is supported for these files, or the
+            source reports a size of 0 (as procfs and sysfs files do)
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                return
+            except OSError:
+                pass
+        if not hasattr(os, "copy_file_range"):
+            raise OSError("copy_file_range is not available")
+        if os.fstat(src_fd).st_size == 0:
+            # The size cannot be trusted; let the caller copy through userspace
+            raise OSError("source reports a size of 0")
+        # Copy until end of file rather than st_size, so growing or shrinking
+        # files are copied as they are read
+        while os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE):
+            pass
+
+
+def _fast_copy2(src: str, dst: str) -> str:
+    """
+    Copy a file and its metadata, using a reflink or in-kernel copy if possible.
+
+    Drop-in replacement for shutil.copy2, usable as the copy_function of
+    shutil.copytree. Non-regular files, copies onto the source itself and
+    filesystems without kernel copy support fall back to shutil.copy2.
+
+    Args:
+        src: Source file path
+        dst: Destination file or directory path
+
+    Returns:
+        The destination file path
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        if not stat.S_ISREG(os.stat(src).st_mode) or (
+            os.path.exists(dst) and os.path.samefile(src, dst)
+        ):
+            return shutil.copy2(src, dst)
+        _copy_file_contents(src, dst)
+    except OSError:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _has_many_entries(path: str | Path) -> bool:
+    """
+    Check whether a directory has enough entries to be worth copying in parallel.
+
+    Args:
+        path: Directory path
+
+    Returns:
+        True if the directory has more than _PARALLEL_COPY_MIN_ENTRIES entries
+    """
+    with os.scandir(path) as entries:
+        for count, _ in enumerate(entries, 1):
+            if count > _PARALLEL_COPY_MIN_ENTRIES:
+                return True
+    return False
+
+
+def _build_copy_plan(
+    src: str, dst: str, errors: list[tuple[str, str, str]]
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """
+    Walk a source tree, creating its directories under the destination.
+
+    Directories that cannot be listed are recorded in errors, in the
+    (source, destination, message) form used by shutil.Error.
+
+    Args:
+        src: Source directory
+        dst: Destination directory, which must already exist
+        errors: List that listing errors are appended to
+
+    Returns:
+        The (source, destination) pairs of every directory and every file
+    """
+
+    def on_error(e: OSError) -> None:
+        src_dir = src if e.filename is None else os.fspath(e.filename)
+        dst_dir = os.path.join(dst, os.path.relpath(src_dir, src))
+        errors.append((src_dir, dst_dir, str(e)))
+
+    directories: list[tuple[str, str]] = [(src, dst)]
+    files: list[tuple[str, str]] = []
+    for dirpath, dirnames, filenames in os.walk(
+        src, onerror=on_error, followlinks=True
+    ):
+        target = os.path.join(dst, os.path.relpath(dirpath, src))
+        for name in dirnames:
+            target_dir = os.path.join(target, name)
+            os.makedirs(target_dir, exist_ok=True)
+            directories.append((os.path.join(dirpath, name), target_dir))
+        for name in filenames:
+            files.append((os.path.join(dirpath, name), os.path.join(target, name)))
+    return directories, files
+
+
+def _parallel_copytree(
+    src: str | Path,
+    dst: str | Path,
+    dirs_exist_ok: bool = False,
+    workers: int | None = None,
+) -> None:
+    """
+    Copy a directory tree, copying the files concurrently on a thread pool.
+
+    Directories are created up front in a single walk; file copies then
+    overlap their I/O latency on worker threads. Mirrors shutil.copytree
+    with copy_function=_fast_copy2, including raising shutil.Error with
+    every failed copy and unreadable directory once all copies have finished.
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+        dirs_exist_ok: If True, copy into an existing destination directory
+        workers: Number of worker threads (defaults to 4 per CPU, at most 32)
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+    os.makedirs(dst, exist_ok=dirs_exist_ok)
+
+    errors: list[tuple[str, str, str]] = []
+    directories, files = _build_copy_plan(src, dst, errors)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (src_file, dst_file, executor.submit(_fast_copy2, src_file, dst_file))
+            for src_file, dst_file in files
+        ]
+        for src_file, dst_file, future in futures:
+            try:
+                future.result()
+            except OSError as e:
+                errors.append((src_file, dst_file, str(e)))
+
+    # Copy directory metadata last, as copying files changes directory mtimes
+    for src_dir, dst_dir in reversed(directories):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+
+    if errors:
+        raise shutil.Error(errors)
+
 
 @wrap_io_errors
-def safe_copy(src: str | Path, dst: str | Path, overwrite: bool = False) -> Path:
+def safe_copy(
+    src: str | Path,
+    dst: str | Path,
+    overwrite: bool = False,
+    parallel: bool | None = None,
+) -> Path:
     """
     Safely copy a file or directory.
 
@@ -31,6 +241,8 @@ def safe_copy(src: str | Path, dst: str | Path, overwrite: bool = False) -> Path
         src: Source path
         dst: Destination path
         overwrite: If True, overwrite destination if it exists
+        parallel: Copy directory contents on a thread pool. By default this
+            is enabled for directories with more than 32 top-level entries.
 
     Returns:
         Path object for the destination
@@ -40,35 +252,49 @@ def safe_copy(src: str | Path, dst: str | Path, overwrite: bool = False) -> Path
         QuackFileExistsError: If destination exists and overwrite is False
         QuackPermissionError: If permission is denied
         QuackIOError: For other IO related issues
+
+    Note:
+        Files are cloned (reflinked) on filesystems that support it. When
+        overwriting a directory, the source tree is copied into the existing
+        destination, so files that only exist in the destination are kept.
     """
-    src_path = Path(src)
+    src = os.fspath(src)
     dst_path = Path(dst)
+    dst_str = os.fspath(dst_path)
 
-    if not src_path.exists():
-        logger.error(f"Source does not exist: {src}")
-        raise QuackFileNotFoundError(str(src))
+    src_stat = _stat_or_none(src)
+    if src_stat is None:
+        logger.error("Source does not exist: %s", src)
+        raise QuackFileNotFoundError(src)
 
-    if dst_path.exists() and not overwrite:
-        logger.error(f"Destination exists and overwrite is False: {dst}")
+    if not overwrite and _stat_or_none(dst_str) is not None:
+        logger.error("Destination exists and overwrite is False: %s", dst)
         raise QuackFileExistsError(str(dst))
 
     try:
-        if src_path.is_dir():
-            logger.info(f"Copying directory {src} to {dst}")
-            if dst_path.exists() and overwrite:
-                logger.debug(f"Removing existing destination directory: {dst}")
-                shutil.rmtree(dst_path)
-            shutil.copytree(src_path, dst_path)
+        if stat.S_ISDIR(src_stat.st_mode):
+            logger.info("Copying directory %s to %s", src, dst)
+            if parallel is None:
+                parallel = _has_many_entries(src)
+            if parallel:
+                _parallel_copytree(src, dst_str, dirs_exist_ok=overwrite)
+            else:
+                shutil.copytree(
+                    src,
+                    dst_str,
+                    copy_function=_fast_copy2,
+                    dirs_exist_ok=overwrite,
+                )
         else:
-            logger.info(f"Copying file {src} to {dst}")
-            ensure_directory(dst_path.parent)
-            shutil.copy2(src_path, dst_path)
+            logger.info("Copying file %s to %s", src, dst)
+            ensure_directory(os.path.dirname(dst_str) or ".")
+            _fast_copy2(src, dst_str)
         return dst_path
     except PermissionError as e:
-        logger.error(f"Permission denied when copying {src} to {dst}: {e}")
+        logger.error("Permission denied when copying %s to %s: %s", src, dst, e)
         raise QuackPermissionError(str(dst), "copy", original_error=e) from e
     except Exception as e:
-        logger.error(f"Failed to copy {src} to {dst}: {e}")
+        logger.error("Failed to copy %s to %s: %s", src, dst, e)
         raise QuackIOError(
             f"Failed to copy {src} to {dst}: {str(e)}", str(dst), original_error=e
         ) from e
@@ -93,34 +319,50 @@ def safe_move(src: str | Path, dst: str | Path, overwrite: bool = False) -> Path
         QuackPermissionError: If permission is denied
         QuackIOError: For other IO related issues
     """
-    src_path = Path(src)
+    src = os.fspath(src)
     dst_path = Path(dst)
+    dst_str = os.fspath(dst_path)
 
-    if not src_path.exists():
-        logger.error(f"Source does not exist: {src}")
-        raise QuackFileNotFoundError(str(src))
+    src_stat = _stat_or_none(src)
+    if src_stat is None:
+        logger.error("Source does not exist: %s", src)
+        raise QuackFileNotFoundError(src)
 
-    if dst_path.exists() and not overwrite:
-        logger.error(f"Destination exists and overwrite is False: {dst}")
+    dst_stat = _stat_or_none(dst_str)
+    if dst_stat is not None and not overwrite:
+        logger.error("Destination exists and overwrite is False: %s", dst)
         raise QuackFileExistsError(str(dst))
 
     try:
-        logger.info(f"Moving {src} to {dst}")
-        ensure_directory(dst_path.parent)
-        if dst_path.exists() and overwrite:
-            if dst_path.is_dir():
-                logger.debug(f"Removing existing destination directory: {dst}")
-                shutil.rmtree(dst_path)
+        logger.info("Moving %s to %s", src, dst)
+        ensure_directory(os.path.dirname(dst_str) or ".")
+        # os.replace swaps files atomically but cannot replace a directory
+        # or put a directory in place of a file, so clear those first
+        if dst_stat is not None and (
+            stat.S_ISDIR(dst_stat.st_mode) or stat.S_ISDIR(src_stat.st_mode)
+        ):
+            if stat.S_ISDIR(dst_stat.st_mode):
+                logger.debug("Removing existing destination directory: %s", dst)
+                shutil.rmtree(dst_str)
+            else:
+                logger.debug("Removing existing destination file: %s", dst)
+                os.unlink(dst_str)
+        try:
+            if overwrite:
+                os.replace(src, dst_str)
             else:
-                logger.debug(f"Removing existing destination file: {dst}")
-                dst_path.unlink()
-        shutil.move(str(src_path), str(dst_path))
+                os.rename(src, dst_str)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Source and destination are on different filesystems
+            shutil.move(src, dst_str)
         return dst_path
     except PermissionError as e:
-        logger.error(f"Permission denied when moving {src} to {dst}: {e}")
+        logger.error("Permission denied when moving %s to %s: %s", src, dst, e)
         raise QuackPermissionError(str(dst), "move", original_error=e) from e
     except Exception as e:
-        logger.error(f"Failed to move {src} to {dst}: {e}")
+        logger.error("Failed to move %s to %s: %s", src, dst, e)
         raise QuackIOError(
             f"Failed to move {src} to {dst}: {str(e)}", str(dst), original_error=e
         ) from e
@@ -144,28 +386,29 @@ def safe_delete(path: str | Path, missing_ok: bool = True) -> bool:
         QuackPermissionError: If permission is denied
         QuackIOError: For other IO related issues
     """
-    path_obj = Path(path)
+    path = os.fspath(path)
 
-    if not path_obj.exists():
+    path_stat = _stat_or_none(path)
+    if path_stat is None:
         if missing_ok:
-            logger.debug(f"Path does not exist but missing_ok is True: {path}")
+            logger.debug("Path does not exist but missing_ok is True: %s", path)
             return False
-        logger.error(f"Path does not exist and missing_ok is False: {path}")
-        raise QuackFileNotFoundError(str(path))
+        logger.error("Path does not exist and missing_ok is False: %s", path)
+        raise QuackFileNotFoundError(path)
 
     try:
-        if path_obj.is_dir():
-            logger.info(f"Deleting directory: {path}")
-            shutil.rmtree(path_obj)
+        if stat.S_ISDIR(path_stat.st_mode):
+            logger.info("Deleting directory: %s", path)
+            shutil.rmtree(path)
         else:
-            logger.info(f"Deleting file: {path}")
-            path_obj.unlink()
+            logger.info("Deleting file: %s", path)
+            os.unlink(path)
         return True
     except PermissionError as e:
-        logger.error(f"Permission denied when deleting {path}: {e}")
-        raise QuackPermissionError(str(path), "delete", original_error=e) from e
+        logger.error("Permission denied when deleting %s: %s", path, e)
+        raise QuackPermissionError(path, "delete", original_error=e) from e
     except Exception as e:
-        logger.error(f"Failed to delete {path}: {e}")
+        logger.error("Failed to delete %s: %s", path, e)
         raise QuackIOError(
-            f"Failed to delete {path}: {str(e)}", str(path), original_error=e
+            f"Failed to delete {path}: {str(e)}", path, original_error=e
         ) from e
@@ -8,21 +8,158 @@ allowing for dynamic loading and access to integration services.
 This implementation uses native collection types (list, dict), the pipe operator
 for unions, and explicit return type annotations throughout. It also factors
 out helper functions to reduce complexity, in line with best practices for Python 3.13.
+
+Modules loaded with IntegrationRegistry.load_integration_module are scanned for
+integration classes unless they provide a create_integration factory. A module
+can set ``__quackcore_no_scan__ = True`` to skip that scan.
 """
 
 import importlib
+import inspect
+import operator
 import sys
-from collections.abc import Iterable
-from importlib.metadata import EntryPoint  # type: ignore
+import weakref
+from collections.abc import Callable, Iterable, Sequence
+from functools import cache, partial
+from importlib.metadata import EntryPoint, EntryPoints  # type: ignore
+from importlib.metadata import entry_points as _entry_points
 from types import ModuleType
 from typing import Protocol, TypeVar, cast
 
 from quackcore.errors import QuackError
 from quackcore.integrations.core.protocols import IntegrationProtocol
+from quackcore.integrations.core.results import IntegrationResult
 from quackcore.logging import LOG_LEVELS, LogLevel, get_logger
 
 T = TypeVar("T", bound=IntegrationProtocol)
 
+# Sentinel distinguishing a missing registry entry from any stored value.
+_MISSING = object()
+
+# Attributes every integration must provide (see IntegrationProtocol).
+_REQUIRED_ATTRS = frozenset({"name", "version", "initialize", "is_available"})
+# Reads the required attributes of an instance in a single C-level call.
+_GET_REQUIRED_ATTRS = operator.attrgetter(
+    "name", "version", "initialize", "is_available"
+)
+# Attributes an integration class must define itself; name and version may be
+# set per instance in __init__.
+_REQUIRED_METHODS = frozenset({"initialize", "is_available"})
+
+# Module attributes skipped by the class scan in _load_integrations_from_module.
+# TestIntegration is handled separately before the scan.
+_SKIP_PREFIX = "_"
+_SKIP_NAMES = frozenset({"TestIntegration"})
+
+
+def _class_provides(cls: type, attrs: frozenset[str] = _REQUIRED_ATTRS) -> bool:
+    """
+    Check whether a class or one of its bases defines all of the given names.
+
+    The class namespaces are searched directly, so no descriptors run and no
+    AttributeError is raised and caught per missing attribute. Most classes
+    define everything themselves, so the first namespace usually settles it.
+
+    Args:
+        cls: The class to inspect.
+        attrs: Attribute names that must be defined.
+
+    Returns:
+        bool: True if every name is defined somewhere in the class MRO.
+    """
+    missing: Iterable[str] = attrs
+    for klass in cls.__mro__:
+        namespace = vars(klass)
+        missing = [attr for attr in missing if attr not in namespace]
+        if not missing:
+            return True
+    return False
+
+
+# Whether instances of a class satisfy IntegrationProtocol through class-level
+# attributes. Weak keys let dynamically created classes be collected.
+_PROTO_CACHE: weakref.WeakKeyDictionary[type, bool] = weakref.WeakKeyDictionary()
+
+
+def _is_integration(obj: object) -> bool:
+    """
+    Check whether an object satisfies the minimal IntegrationProtocol contract.
+
+    The verdict for the object's class is computed once and cached, so the
+    check for further instances of a conforming class is a dictionary lookup.
+    Objects whose class does not conform are checked individually, since the
+    attributes may be set per instance.
+
+    Args:
+        obj: The object to validate.
+
+    Returns:
+        bool: True if the object provides name, version and callable
+        initialize and is_available attributes.
+    """
+    cls = type(obj)
+    verdict = _PROTO_CACHE.get(cls)
+    if verdict is None:
+        verdict = (
+            _class_provides(cls)
+            and callable(getattr(cls, "initialize", None))
+            and callable(getattr(cls, "is_available", None))
+        )
+        _PROTO_CACHE[cls] = verdict
+    if verdict:
+        return True
+
+    try:
+        _, _, initialize, is_available = _GET_REQUIRED_ATTRS(obj)
+    except AttributeError:
+        return False
+    return callable(initialize) and callable(is_available)
+
+
+@cache
+def _all_entry_points() -> EntryPoints:
+    """
+    Scan the installed distributions for entry points once per process.
+
+    Returns:
+        EntryPoints: Every installed entry point.
+    """
+    return _entry_points()
+
+
+@cache
+def _cached_entry_points(group: str) -> tuple[EntryPoint, ...]:
+    """
+    Retrieve the entry points for a group, cached for the process lifetime.
+
+    The groups are selected from a single unfiltered scan, since each
+    entry_points(group=...) call rescans and sorts every distribution. The
+    result is kept until refresh_entry_points is called.
+
+    Args:
+        group: The entry point group to search.
+
+    Returns:
+        tuple[EntryPoint, ...]: The entry points in the group.
+    """
+    all_eps = _all_entry_points()
+    try:
+        return tuple(all_eps.select(group=group))
+    except AttributeError:
+        # Pre-3.10 importlib.metadata returns a dict of group -> entry points
+        return tuple(all_eps.get(group, ()))  # type: ignore[attr-defined]
+
+
+def refresh_entry_points() -> None:
+    """
+    Clear the cached entry points.
+
+    Call this after installing or removing packages at runtime so the next
+    discovery sees the new entry points.
+    """
+    _all_entry_points.cache_clear()
+    _cached_entry_points.cache_clear()
+
 
 class PluginLoaderProtocol(Protocol):
     def load_plugin(self, identifier: str) -> object:
@@ -32,6 +169,109 @@ class PluginLoaderProtocol(Protocol):
         ...
 
 
+class _LazyIntegration:
+    """
+    Placeholder for an entry point integration that has not been imported yet.
+
+    The proxy is registered under the entry point name and only imports and
+    instantiates the real integration the first time it is used, through
+    initialize, is_available, version or any other attribute.
+    """
+
+    __slots__ = ("_entry", "_loader", "_real")
+
+    def __init__(
+        self,
+        entry: EntryPoint,
+        loader: Callable[[], IntegrationProtocol | None],
+    ) -> None:
+        """
+        Initialize the proxy.
+
+        Args:
+            entry: The entry point the integration is loaded from.
+            loader: Callable that loads the integration, or returns None.
+        """
+        self._entry = entry
+        self._loader: Callable[[], IntegrationProtocol | None] | None = loader
+        self._real: IntegrationProtocol | None = None
+
+    @property
+    def name(self) -> str:
+        """Name of the entry point the integration is registered under."""
+        return self._entry.name
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the real integration has been loaded."""
+        return self._real is not None
+
+    def materialize(self) -> IntegrationProtocol:
+        """
+        Load the real integration, importing it on first use.
+
+        Returns:
+            IntegrationProtocol: The loaded integration.
+
+        Raises:
+            QuackError: If the entry point did not provide an integration.
+        """
+        if self._real is None:
+            # Loading is attempted once; failures are logged by the loader
+            loader, self._loader = self._loader, None
+            if loader is not None:
+                self._real = loader()
+            if self._real is None:
+                raise QuackError(
+                    f"Integration '{self.name}' could not be loaded",
+                    {"integration_name": self.name, "entry_point": self._entry.value},
+                )
+        return self._real
+
+    @property
+    def version(self) -> str:
+        """Version of the loaded integration."""
+        return self.materialize().version
+
+    def initialize(self) -> IntegrationResult:
+        """
+        Load and initialize the integration.
+
+        Returns:
+            IntegrationResult: Result of initialization.
+        """
+        try:
+            integration = self.materialize()
+        except QuackError as e:
+            return IntegrationResult.error_result(str(e))
+        return integration.initialize()
+
+    def is_available(self) -> bool:
+        """
+        Check if the integration can be loaded and is available.
+
+        Returns:
+            bool: True if the integration is available.
+        """
+        try:
+            integration = self.materialize()
+        except QuackError:
+            return False
+        return integration.is_available()
+
+    def __getattr__(self, item: str) -> object:
+        """Delegate any other attribute to the loaded integration."""
+        # Slots that are not initialized (e.g. on a bare copy) must not recurse
+        if item in _LazyIntegration.__slots__:
+            raise AttributeError(item)
+        return getattr(self.materialize(), item)
+
+    def __repr__(self) -> str:
+        """Return a representation that does not trigger loading."""
+        state = "loaded" if self._real is not None else "not loaded"
+        return f"<_LazyIntegration {self.name!r} ({state})>"
+
+
 class IntegrationRegistry:
     """Registry for QuackCore integrations."""
 
@@ -45,26 +285,88 @@ class IntegrationRegistry:
         self.logger = get_logger(__name__)
         self.logger.setLevel(log_level)
         self._integrations: dict[str, IntegrationProtocol] = {}
+        # Registered integrations indexed by every class in their MRO
+        self._by_type: dict[type, list[IntegrationProtocol]] = {}
+        # Snapshot of the registered names, rebuilt after the registry changes
+        self._names_cache: tuple[str, ...] | None = None
+        # Entry points whose integrations are registered, and the reverse map
+        # from integration name to entry point name used on unregistration
+        self._registered_entry_names: set[str] = set()
+        self._entry_name_by_integration: dict[str, str] = {}
+        # The plugin loader lookup result, wrapped so None can be cached too
+        self._plugin_loader_cache: tuple[PluginLoaderProtocol | None] | None = None
 
     def register(self, integration: IntegrationProtocol) -> None:
         """
         Register an integration with the registry.
 
+        Integration names should be short identifiers; they are interned so
+        lookups with interned or literal names compare by identity.
+
         Args:
             integration: Integration to register.
 
         Raises:
             QuackError: If the integration is already registered.
         """
-        integration_name = integration.name
-        if integration_name in self._integrations:
+        integration_name = sys.intern(integration.name)
+        integrations = self._integrations
+        # A single setdefault both checks and inserts; the size tells which
+        size = len(integrations)
+        integrations.setdefault(integration_name, integration)
+        if len(integrations) == size:
             raise QuackError(
                 f"Integration '{integration_name}' is already registered",
                 {"integration_name": integration_name},
             )
-        self._integrations[integration_name] = integration
+        self._index_by_type(integration)
+        self._names_cache = None
         self.logger.debug(f"Registered integration: {integration_name}")
 
+    def register_many(self, integrations: Sequence[IntegrationProtocol]) -> None:
+        """
+        Register several integrations at once.
+
+        Either all of the integrations are registered or, if any name is
+        already registered or repeated within the batch, none of them are.
+
+        Args:
+            integrations: Integrations to register.
+
+        Raises:
+            QuackError: If any integration name is already registered.
+        """
+        if not integrations:
+            return
+        new: dict[str, IntegrationProtocol] = {}
+        duplicates: list[str] = []
+        for integration in integrations:
+            name = sys.intern(integration.name)
+            if name in new or name in self._integrations:
+                duplicates.append(name)
+            else:
+                new[name] = integration
+        if duplicates:
+            raise QuackError(
+                f"Integrations already registered: {', '.join(duplicates)}",
+                {"integration_names": duplicates},
+            )
+        self._integrations.update(new)
+        self._names_cache = None
+        for integration in integrations:
+            self._index_by_type(integration)
+        self.logger.debug("Registered %d integrations: %s", len(new), list(new))
+
+    def _index_by_type(self, integration: IntegrationProtocol) -> None:
+        """
+        Add an integration to the type index under every class in its MRO.
+
+        Args:
+            integration: The integration to index.
+        """
+        for cls in type(integration).__mro__[:-1]:  # All bases except object
+            self._by_type.setdefault(cls, []).append(integration)
+
     def unregister(self, name: str) -> bool:
         """
         Unregister an integration from the registry.
@@ -75,13 +377,23 @@ class IntegrationRegistry:
         Returns:
             bool: True if the integration was unregistered, False if not found.
         """
-        if name in self._integrations:
-            del self._integrations[name]
-            self.logger.debug(f"Unregistered integration: {name}")
-            return True
-
-        self.logger.warning(f"Integration not found for unregistration: {name}")
-        return False
+        removed = self._integrations.pop(name, _MISSING)
+        if removed is _MISSING:
+            self.logger.warning(f"Integration not found for unregistration: {name}")
+            return False
+
+        self._names_cache = None
+        entry_name = self._entry_name_by_integration.pop(name, None)
+        if entry_name is not None:
+            self._registered_entry_names.discard(entry_name)
+        integration = cast(IntegrationProtocol, removed)
+        for cls in type(integration).__mro__[:-1]:
+            by_type = self._by_type[cls]
+            by_type.remove(integration)
+            if not by_type:
+                del self._by_type[cls]
+        self.logger.debug(f"Unregistered integration: {name}")
+        return True
 
     def get_integration(self, name: str) -> IntegrationProtocol | None:
         """
@@ -95,28 +407,43 @@ class IntegrationRegistry:
         """
         return self._integrations.get(name)
 
-    def get_integration_by_type(self, integration_type: type[T]) -> Iterable[T]:
+    def get_integration_by_type(self, integration_type: type[T]) -> tuple[T, ...]:
         """
         Get all integrations of a specific type.
 
+        Classes are looked up in an index of the registered integrations'
+        base classes, so virtual subclasses registered with ABC.register are
+        not matched. Protocols match structurally and still use an isinstance
+        scan.
+
         Args:
             integration_type: Type of integrations to get.
 
         Returns:
-            Iterable[T]: Integrations of the specified type.
+            tuple[T, ...]: Integrations of the specified type.
         """
-        for integration in self._integrations.values():
-            if isinstance(integration, integration_type):
-                yield integration
+        if getattr(integration_type, "_is_protocol", False):
+            return tuple(
+                integration
+                for integration in self._integrations.values()
+                if isinstance(integration, integration_type)
+            )
+        return tuple(cast(list[T], self._by_type.get(integration_type, ())))
 
-    def list_integrations(self) -> list[str]:
+    def list_integrations(self) -> tuple[str, ...]:
         """
-        Get a list of all registered integration names.
+        Get all registered integration names.
+
+        The same tuple is returned until an integration is registered or
+        unregistered.
 
         Returns:
-            list[str]: List of integration names.
+            tuple[str, ...]: Integration names in registration order.
         """
-        return list(self._integrations.keys())
+        names = self._names_cache
+        if names is None:
+            names = self._names_cache = tuple(self._integrations)
+        return names
 
     def is_registered(self, name: str) -> bool:
         """
@@ -130,32 +457,96 @@ class IntegrationRegistry:
         """
         return name in self._integrations
 
-    def discover_integrations(self) -> list[IntegrationProtocol]:
+    def discover_integrations(self, lazy: bool = False) -> list[IntegrationProtocol]:
         """
         Discover integrations from entry points.
 
+        Entry points whose integration is already registered are skipped, so
+        repeated discovery only loads entry points that are new or whose
+        integration was unregistered since.
+
+        Args:
+            lazy: If True, register a proxy per entry point under the entry
+                point name without importing anything; each integration is
+                imported on first use instead. Proxies are only indexed as
+                _LazyIntegration, so get_integration_by_type does not return
+                them for the concrete integration class.
+
         Returns:
-            list[IntegrationProtocol]: Discovered integrations.
+            list[IntegrationProtocol]: Newly discovered integrations.
         """
-        discovered_integrations: list[IntegrationProtocol] = []
+        candidates: list[tuple[EntryPoint, IntegrationProtocol]] = []
         plugin_loader: PluginLoaderProtocol | None = self._get_plugin_loader()
         entry_points_list: list[EntryPoint] = self._get_entry_points(
             "quackcore.integrations"
         )
 
+        registered_entry_names = self._registered_entry_names
         for entry in entry_points_list:
-            integration = self._load_integration_from_entry(entry, plugin_loader)
+            if entry.name in registered_entry_names:
+                continue
+            integration = self._discover_entry(entry, plugin_loader, lazy)
             if integration is not None:
-                try:
-                    self.register(integration)
-                    discovered_integrations.append(integration)
-                except QuackError as err:
-                    self.logger.error(
-                        f"Error registering integration {entry.name}: {err}"
-                    )
+                candidates.append((entry, integration))
+
+        integrations = [integration for _, integration in candidates]
+        try:
+            self.register_many(integrations)
+        except QuackError:
+            pass
+        else:
+            for entry, integration in candidates:
+                self._track_entry(entry, integration)
+            return integrations
+
+        # Register one at a time to keep the non-colliding integrations
+        discovered_integrations: list[IntegrationProtocol] = []
+        for entry, integration in candidates:
+            try:
+                self.register(integration)
+            except QuackError as err:
+                self.logger.error(f"Error registering integration {entry.name}: {err}")
+            else:
+                self._track_entry(entry, integration)
+                discovered_integrations.append(integration)
 
         return discovered_integrations
 
+    def _discover_entry(
+        self,
+        entry: EntryPoint,
+        plugin_loader: PluginLoaderProtocol | None,
+        lazy: bool,
+    ) -> IntegrationProtocol | None:
+        """
+        Load the integration for an entry point, or wrap it in a lazy proxy.
+
+        Args:
+            entry: The entry point to discover.
+            plugin_loader: Optional plugin loader.
+            lazy: If True, return a proxy that loads the integration on use.
+
+        Returns:
+            IntegrationProtocol | None: The integration or proxy, or None if
+            the entry point could not be loaded.
+        """
+        if lazy:
+            return _LazyIntegration(
+                entry, partial(self._load_integration_from_entry, entry, plugin_loader)
+            )
+        return self._load_integration_from_entry(entry, plugin_loader)
+
+    def _track_entry(self, entry: EntryPoint, integration: IntegrationProtocol) -> None:
+        """
+        Record that an entry point's integration has been registered.
+
+        Args:
+            entry: The entry point the integration was loaded from.
+            integration: The registered integration.
+        """
+        self._registered_entry_names.add(entry.name)
+        self._entry_name_by_integration[sys.intern(integration.name)] = entry.name
+
     def load_integration_module(self, module_path: str) -> list[IntegrationProtocol]:
         """
         Load integrations from a module.
@@ -200,14 +591,17 @@ class IntegrationRegistry:
                     f"Error registering integration from create_integration: {err}"
                 )
 
-        # Otherwise, search for integration classes defined in the module.
-        integrations_from_module = self._load_integrations_from_module(module)
-        for integ in integrations_from_module:
-            try:
-                self.register(integ)
-                loaded_integrations.append(integ)
-            except QuackError as err:
-                self.logger.error(f"Error registering integration {integ.name}: {err}")
+        # Otherwise, search for integration classes defined in the module,
+        # unless the module opted out of the scan.
+        if not getattr(module, "__quackcore_no_scan__", False):
+            for integ in self._load_integrations_from_module(module):
+                try:
+                    self.register(integ)
+                    loaded_integrations.append(integ)
+                except QuackError as err:
+                    self.logger.error(
+                        f"Error registering integration {integ.name}: {err}"
+                    )
 
         if not loaded_integrations:
             self.logger.warning(f"No integrations found in module {module_path}")
@@ -227,10 +621,8 @@ class IntegrationRegistry:
         Raises:
             QuackError: If the module cannot be imported.
         """
+        # import_module returns modules already in sys.modules directly.
         try:
-            modules_dict = sys.modules
-            if module_path in modules_dict:
-                return modules_dict[module_path]  # type: ignore
             return importlib.import_module(module_path)
         except ImportError as e:
             error_msg = f"Failed to import module {module_path}: {e}"
@@ -249,10 +641,31 @@ class IntegrationRegistry:
                 original_error=e,
             ) from e
 
+    def invalidate_plugin_loader_cache(self) -> None:
+        """
+        Forget the cached plugin loader so the next lookup imports it again.
+        """
+        self._plugin_loader_cache = None
+
     def _get_plugin_loader(self) -> PluginLoaderProtocol | None:
         """
         Retrieve QuackCore's plugin loader if available.
 
+        The lookup result is cached on the registry; see
+        invalidate_plugin_loader_cache.
+
+        Returns:
+            PluginLoaderProtocol or None if not available.
+        """
+        cached = self._plugin_loader_cache
+        if cached is None:
+            cached = self._plugin_loader_cache = (self._find_plugin_loader(),)
+        return cached[0]
+
+    def _find_plugin_loader(self) -> PluginLoaderProtocol | None:
+        """
+        Look up QuackCore's plugin loader, importing its module if needed.
+
         Returns:
             PluginLoaderProtocol or None if not available.
         """
@@ -283,6 +696,8 @@ class IntegrationRegistry:
         """
         Retrieve entry points for a given group.
 
+        Results are cached module-wide; see refresh_entry_points.
+
         Args:
             group: The entry point group to search.
 
@@ -290,10 +705,7 @@ class IntegrationRegistry:
             list[EntryPoint]: A list of entry point objects.
         """
         try:
-            from importlib.metadata import entry_points
-
-            eps = entry_points(group=group)
-            return list(eps)
+            return list(_cached_entry_points(group))
         except Exception as e:
             self.logger.warning(
                 f"Could not discover integrations using entry points: {e}"
@@ -318,8 +730,8 @@ class IntegrationRegistry:
             if plugin_loader is not None:
                 try:
                     plugin = plugin_loader.load_plugin(entry.value)
-                    if isinstance(plugin, IntegrationProtocol):
-                        return plugin
+                    if _is_integration(plugin):
+                        return cast(IntegrationProtocol, plugin)
                 except (ImportError, AttributeError) as e:
                     self.logger.debug(
                         f"Plugin loader failed for {entry.name}: {e}, falling back"
@@ -327,8 +739,8 @@ class IntegrationRegistry:
             factory = entry.load()
             if callable(factory):
                 integration = factory()
-                if isinstance(integration, IntegrationProtocol):
-                    return integration
+                if _is_integration(integration):
+                    return cast(IntegrationProtocol, integration)
                 self.logger.warning(
                     f"Entry point {entry.name} did not return an IntegrationProtocol"
                 )
@@ -358,14 +770,7 @@ class IntegrationRegistry:
         if plugin_loader is not None:
             try:
                 plugin = plugin_loader.load_plugin(module_path)
-                if (
-                    hasattr(plugin, "name")
-                    and hasattr(plugin, "version")
-                    and hasattr(plugin, "initialize")
-                    and hasattr(plugin, "is_available")
-                    and callable(plugin.initialize)
-                    and callable(plugin.is_available)
-                ):
+                if _is_integration(plugin):
                     return cast(IntegrationProtocol, plugin)
             except (ImportError, AttributeError, TypeError, ValueError) as e:
                 self.logger.debug(
@@ -394,15 +799,8 @@ class IntegrationRegistry:
         if callable(create_func):
             try:
                 integration = create_func()
-                if (
-                    hasattr(integration, "name")
-                    and hasattr(integration, "version")
-                    and hasattr(integration, "initialize")
-                    and hasattr(integration, "is_available")
-                    and callable(integration.initialize)
-                    and callable(integration.is_available)
-                ):
-                    return integration
+                if _is_integration(integration):
+                    return cast(IntegrationProtocol, integration)
             except (TypeError, ValueError) as e:
                 self.logger.error(
                     f"Error calling create_integration in {module.__name__}: {e}"
@@ -413,27 +811,6 @@ class IntegrationRegistry:
                 )
         return None
 
-    def _is_valid_integration(self, instance: object) -> bool:
-        """
-        Check whether an instance satisfies the minimal
-        requirements for an IntegrationProtocol.
-
-        Args:
-            instance: The instance to validate.
-
-        Returns:
-            bool: True if valid, else False.
-        """
-        required_attrs = ("name", "version", "initialize", "is_available")
-        for attr in required_attrs:
-            if not hasattr(instance, attr):
-                return False
-        # Now that we know the attributes exist, cast instance to IntegrationProtocol.
-        integration_instance = cast(IntegrationProtocol, instance)
-        return callable(integration_instance.initialize) and callable(
-            integration_instance.is_available
-        )
-
     def _try_instantiate_integration(
         self, integration_cls: type, attr_name: str | None = None
     ) -> IntegrationProtocol | None:
@@ -450,7 +827,7 @@ class IntegrationRegistry:
         name_to_log = attr_name if attr_name is not None else integration_cls.__name__
         try:
             instance = integration_cls()
-            if self._is_valid_integration(instance):
+            if _is_integration(instance):
                 return instance
         except (TypeError, ValueError) as e:
             self.logger.error(f"Error instantiating {name_to_log}: {e}")
@@ -464,6 +841,10 @@ class IntegrationRegistry:
         """
         Search the module for integration classes that are defined within it.
 
+        Only classes that define initialize and is_available (directly or
+        through a base class) are instantiated. Name and version may be set
+        in __init__, so each instance is validated after instantiation.
+
         Args:
             module: The module object.
 
@@ -472,34 +853,37 @@ class IntegrationRegistry:
         """
         integrations: list[IntegrationProtocol] = []
 
-        # Handle special test integration case.
-        try:
-            test_integration = module.TestIntegration  # Direct attribute access.
-            if isinstance(test_integration, type):
-                instance = self._try_instantiate_integration(
-                    test_integration, "TestIntegration"
-                )
+        # Handle special test integration case. The lookup is static so a
+        # module-level __getattr__ (PEP 562) is never consulted.
+        test_integration = inspect.getattr_static(module, "TestIntegration", None)
+        if isinstance(test_integration, type):
+            instance = self._try_instantiate_integration(
+                test_integration, "TestIntegration"
+            )
+            if instance is not None:
+                integrations.append(instance)
+
+        # Search through all attributes of the module. Most are not classes,
+        # so test the exact type first and only fall back to issubclass for
+        # metaclasses, skipping the generic isinstance dispatch. Names used
+        # on every iteration are bound to locals once. Namespaces are read
+        # with vars() so no descriptor runs and nothing can raise; the items
+        # are snapshotted since instantiating a class may rebind globals.
+        type_ = type
+        module_name = getattr(module, "__name__", "")
+        protocol = IntegrationProtocol
+        for attr_name, attr in list(vars(module).items()):
+            if attr_name[:1] == _SKIP_PREFIX or attr_name in _SKIP_NAMES:
+                continue
+            attr_type = type_(attr)
+            if (
+                (attr_type is type_ or issubclass(attr_type, type_))
+                and vars(attr).get("__module__") == module_name
+                and attr is not protocol
+                and _class_provides(attr, _REQUIRED_METHODS)
+            ):
+                instance = self._try_instantiate_integration(attr, attr_name)
                 if instance is not None:
                     integrations.append(instance)
-        except AttributeError:
-            pass
-
-        # Search through all attributes of the module.
-        for attr_name in dir(module):
-            if attr_name.startswith("_") or attr_name == "TestIntegration":
-                continue
-            try:
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and attr.__module__ == module.__name__
-                    and attr is not IntegrationProtocol
-                ):
-                    instance = self._try_instantiate_integration(attr, attr_name)
-                    if instance is not None:
-                        integrations.append(instance)
-            except Exception as e:
-                self.logger.error(f"Error accessing attribute {attr_name}: {e}")
-                continue
 
         return integrations
@@ -4,6 +4,7 @@ Shared fixtures for QuackCore tests.
 """
 
 import shutil
+import socket
 import tempfile
 from collections.abc import Generator  # Changed from typing to collections.abc
 from pathlib import Path
@@ -129,3 +130,19 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "integration: mark a test as an integration test"
     )
+    config.addinivalue_line(
+        "markers", "no_network: fail the test if it opens a network connection"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_network(request: pytest.FixtureRequest, monkeypatch: MonkeyPatch) -> None:
+    """Block socket connections for tests marked no_network."""
+    if request.node.get_closest_marker("no_network") is None:
+        return
+
+    def _blocked_connect(*args: object, **kwargs: object) -> None:
+        raise RuntimeError("Network access is disabled for no_network tests")
+
+    monkeypatch.setattr(socket.socket, "connect", _blocked_connect)
+    monkeypatch.setattr(socket.socket, "connect_ex", _blocked_connect)
@@ -3,7 +3,9 @@
 Tests for configuration loading utilities.
 """
 
+import copy
 import os
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -12,18 +14,25 @@ import pytest
 import yaml
 
 from quackcore.config.loader import (
+    _WATCHED_FILES,
+    CONFIG_WATCH_ENV,
     DEFAULT_CONFIG_LOCATIONS,
     DEFAULT_CONFIG_VALUES,
+    LazyQuackConfig,
     _convert_env_value,
     _deep_merge,
+    _first_existing,
     _get_env_config,
-    _is_float,
+    _on_config_file_event,
+    _stop_config_watchers,
+    clear_config_cache,
     find_config_file,
     load_config,
+    load_config_lazy,
     load_yaml_config,
     merge_configs,
 )
-from quackcore.config.models import QuackConfig
+from quackcore.config.models import GeneralConfig, QuackConfig
 from quackcore.errors import QuackConfigurationError
 
 
@@ -46,6 +55,10 @@ class TestConfigLoader:
         loaded = load_yaml_config(config_file)
         assert loaded == config_data
 
+        # Test that parsed keys are interned
+        key = next(k for k in loaded["general"] if k == "project_name")
+        assert key is sys.intern("".join(["project", "_name"]))
+
         # Test loading empty YAML
         empty_file = temp_dir / "empty.yaml"
         empty_file.touch()
@@ -62,6 +75,39 @@ class TestConfigLoader:
         with pytest.raises(QuackConfigurationError):
             load_yaml_config(temp_dir / "nonexistent.yaml")
 
+    def test_load_yaml_config_expands_env_vars(self, temp_dir: Path) -> None:
+        """Test that ${VAR} references and ~ are expanded in string values."""
+        config_file = temp_dir / "expand.yaml"
+        config_file.write_text(
+            "paths:\n"
+            "  base_dir: ${QUACK_TEST_ROOT}/project\n"
+            "  output_dir: ~/output\n"
+            "  temp_dir: ${QUACK_TEST_UNSET}/tmp\n"
+            "plugins:\n"
+            "  paths:\n"
+            "    - ${QUACK_TEST_ROOT}/plugins\n"
+            "general:\n"
+            "  project_name: $QUACK_TEST_ROOT\n"
+            "  port: 8080\n"
+        )
+
+        with patch.dict(os.environ, {"QUACK_TEST_ROOT": "/srv/quack"}):
+            os.environ.pop("QUACK_TEST_UNSET", None)
+            config = load_yaml_config(config_file)
+
+        assert config["paths"]["base_dir"] == "/srv/quack/project"
+        assert config["paths"]["output_dir"] == os.path.expanduser("~/output")
+        # Unset variables and bare $VAR references are left as written
+        assert config["paths"]["temp_dir"] == "${QUACK_TEST_UNSET}/tmp"
+        assert config["general"]["project_name"] == "$QUACK_TEST_ROOT"
+        assert config["general"]["port"] == 8080
+        assert config["plugins"]["paths"] == ["/srv/quack/plugins"]
+
+        # Expansion happens per load, not in the cached parse
+        with patch.dict(os.environ, {"QUACK_TEST_ROOT": "/opt/quack"}):
+            config = load_yaml_config(config_file)
+        assert config["paths"]["base_dir"] == "/opt/quack/project"
+
     def test_deep_merge(self) -> None:
         """Test deep merging of dictionaries."""
         # Test basic merge
@@ -92,16 +138,18 @@ class TestConfigLoader:
         merged = _deep_merge(base, override)
         assert merged == {"a": "not_a_dict", "b": 3, "c": 4}
 
-    def test_is_float(self) -> None:
-        """Test checking if a string represents a float."""
-        assert _is_float("3.14") is True
-        assert _is_float("0.0") is True
-        assert _is_float("-2.5") is True
+        # Test that inputs are not modified
+        base = {"a": {"x": {"i": 1}}, "b": 2}
+        override = {"a": {"x": {"i": 2}}}
+        merged = _deep_merge(base, override)
+        assert merged == {"a": {"x": {"i": 2}}, "b": 2}
+        assert base == {"a": {"x": {"i": 1}}, "b": 2}
+        assert override == {"a": {"x": {"i": 2}}}
 
-        assert _is_float("3") is False  # Integer
-        assert _is_float("3.") is False  # Not a proper float format
-        assert _is_float("abc") is False  # Not a number
-        assert _is_float("3,14") is False  # Wrong decimal separator
+        # Test merging with an empty override returns an equal copy
+        merged = _deep_merge(base, {})
+        assert merged == base
+        assert merged is not base
 
     def test_convert_env_value(self) -> None:
         """Test converting environment variable string values to appropriate types."""
@@ -110,6 +158,8 @@ class TestConfigLoader:
         assert _convert_env_value("True") is True
         assert _convert_env_value("false") is False
         assert _convert_env_value("False") is False
+        assert _convert_env_value("TRUE") is True
+        assert _convert_env_value("FALSE") is False
 
         # Test integer conversion
         assert _convert_env_value("123") == 123
@@ -118,12 +168,29 @@ class TestConfigLoader:
 
         # Test float conversion
         assert _convert_env_value("3.14") == 3.14
+        assert _convert_env_value("0.0") == 0.0
         assert _convert_env_value("-2.5") == -2.5
+        assert isinstance(_convert_env_value("0.0"), float)
+
+        # Test exponents, explicit signs and digit separators
+        assert _convert_env_value("1e-3") == 0.001
+        assert _convert_env_value("2.5E3") == 2500.0
+        assert _convert_env_value("+5") == 5
+        assert _convert_env_value("1_000") == 1000
+        assert isinstance(_convert_env_value("+5"), int)
 
         # Test string values
         assert _convert_env_value("hello") == "hello"
         assert _convert_env_value("123abc") == "123abc"
         assert _convert_env_value("") == ""
+        assert _convert_env_value("3.") == "3."  # Not a proper float format
+        assert _convert_env_value("3,14") == "3,14"  # Wrong decimal separator
+        assert _convert_env_value("1.2.3") == "1.2.3"
+        assert _convert_env_value("-") == "-"
+        assert _convert_env_value("4-2") == "4-2"
+        assert _convert_env_value("²") == "²"  # Non-ASCII digit
+        assert _convert_env_value("release") == "release"
+        assert _convert_env_value("1e") == "1e"
 
     def test_get_env_config(self) -> None:
         """Test getting configuration from environment variables."""
@@ -134,6 +201,7 @@ class TestConfigLoader:
                 "QUACK_GENERAL__PROJECT_NAME": "EnvProject",
                 "QUACK_LOGGING__LEVEL": "DEBUG",
                 "QUACK_PATHS__BASE_DIR": "/env/path",
+                "QUACK_INTEGRATIONS__GOOGLE__CLIENT_SECRETS_FILE": "/env/secrets.json",
                 "QUACK_DEBUG": "true",  # Invalid format (no section)
                 "OTHER_VAR": "ignored",  # Non-QUACK variable
             },
@@ -146,11 +214,25 @@ class TestConfigLoader:
             assert config["logging"]["level"] == "DEBUG"
             assert "paths" in config
             assert config["paths"]["base_dir"] == "/env/path"
+            assert (
+                config["integrations"]["google"]["client_secrets_file"]
+                == "/env/secrets.json"
+            )
             assert "debug" not in config  # Should be ignored (no section)
             assert "other_var" not in config  # Should be ignored (wrong prefix)
 
+            # Repeated calls reuse the parsed result
+            assert _get_env_config() is config
+
+            # Changing a QUACK_* variable is picked up
+            os.environ["QUACK_LOGGING__LEVEL"] = "WARNING"
+            config = _get_env_config()
+            assert config["logging"]["level"] == "WARNING"
+
     def test_find_config_file(self) -> None:
         """Test finding a configuration file in standard locations."""
+        find_config_file.cache_clear()
+
         # Test with QUACK_CONFIG environment variable
         with tempfile.TemporaryDirectory() as tmp:
             tmp_path = Path(tmp)
@@ -177,7 +259,25 @@ class TestConfigLoader:
                 found = find_config_file()
                 assert found == config_path
 
+                # The result is cached until the file disappears
+                with patch("quackcore.config.loader.DEFAULT_CONFIG_LOCATIONS", []):
+                    assert find_config_file() == config_path
+                config_path.unlink()
+                assert find_config_file() != config_path
+
+        # Test that "~" locations follow changes to $HOME
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            config_path = tmp_path / ".quack" / "config.yaml"
+            config_path.parent.mkdir()
+            config_path.touch()
+
+            with patch.dict(os.environ, {"HOME": str(tmp_path)}):
+                found = find_config_file()
+                assert found == config_path
+
         # Test with project root detection
+        find_config_file.cache_clear()
         with tempfile.TemporaryDirectory() as tmp:
             tmp_path = Path(tmp)
 
@@ -197,7 +297,8 @@ class TestConfigLoader:
                 assert found == config_path
 
         # Test when no config file can be found
-        with patch("os.path.exists", return_value=False):
+        find_config_file.cache_clear()
+        with patch("quackcore.config.loader._path_exists", return_value=False):
             with patch(
                 "quackcore.config.loader.resolver.get_project_root",
                 side_effect=Exception,
@@ -205,6 +306,39 @@ class TestConfigLoader:
                 found = find_config_file()
                 assert found is None
 
+        # A miss is not cached, so a file created afterwards is found
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "created_config.yaml"
+            with (
+                patch.dict(os.environ, {"QUACK_CONFIG": str(config_path)}),
+                patch("quackcore.config.loader.DEFAULT_CONFIG_LOCATIONS", []),
+                patch(
+                    "quackcore.config.loader.resolver.get_project_root",
+                    side_effect=Exception,
+                ),
+            ):
+                assert find_config_file() is None
+                config_path.touch()
+                assert find_config_file() == config_path
+
+    def test_first_existing(self, temp_dir: Path) -> None:
+        """Test picking the first existing path among candidates."""
+        (temp_dir / "second.yaml").touch()
+        (temp_dir / "sub").mkdir()
+        (temp_dir / "sub" / "only.yaml").touch()
+        (temp_dir / "broken.yaml").symlink_to(temp_dir / "nowhere.yaml")
+
+        # The first existing candidate wins, in any directory
+        candidates = [temp_dir / "first.yaml", temp_dir / "second.yaml"]
+        assert _first_existing(candidates) == temp_dir / "second.yaml"
+        candidates = [temp_dir / "missing" / "a.yaml", temp_dir / "sub" / "only.yaml"]
+        assert _first_existing(candidates) == temp_dir / "sub" / "only.yaml"
+
+        # Broken symlinks, missing parents and empty lists yield None
+        candidates = [temp_dir / "broken.yaml", temp_dir / "missing" / "b.yaml"]
+        assert _first_existing(candidates) is None
+        assert _first_existing([]) is None
+
     def test_load_config(self) -> None:
         """Test loading configuration from various sources."""
         # Test loading with explicit config path
@@ -283,6 +417,18 @@ class TestConfigLoader:
             assert config.general.project_name == "PartialProject"  # From file
             assert config.logging.level == "INFO"  # Default from model
 
+            # An empty file without overrides validates the defaults directly
+            config_path.write_text("")
+            defaults_snapshot = copy.deepcopy(DEFAULT_CONFIG_VALUES)
+            with (
+                patch.dict(os.environ, {}, clear=True),
+                patch("quackcore.config.loader._deep_merge") as mock_merge,
+            ):
+                config = load_config(config_path)
+                mock_merge.assert_not_called()
+            assert config.general.project_name == "QuackCore"
+            assert DEFAULT_CONFIG_VALUES == defaults_snapshot
+
         # Test with non-existent config file
         with pytest.raises(QuackConfigurationError):
             load_config("/nonexistent/path/config.yaml")
@@ -306,6 +452,158 @@ class TestConfigLoader:
                 # Verify find_config_file was called
                 mock_find.assert_called_once()
 
+    def test_load_config_cache(self, temp_dir: Path) -> None:
+        """Test that loaded configurations are cached until their inputs change."""
+        clear_config_cache()
+        config_path = temp_dir / "cached_config.yaml"
+        config_path.write_text("general:\n  project_name: CachedProject\n")
+
+        with patch(
+            "quackcore.config.loader.load_yaml_config", wraps=load_yaml_config
+        ) as mock_yaml:
+            # Repeated loads are served from the cache as independent copies
+            first = load_config(config_path)
+            cached = load_config(config_path)
+            assert cached == first
+            assert cached is not first
+            cached.general.project_name = "Mutated"
+            assert load_config(config_path).general.project_name == "CachedProject"
+            assert mock_yaml.call_count == 1
+
+            load_config(config_path, merge_defaults=False)
+            assert mock_yaml.call_count == 2
+
+            # Changing the file invalidates the cache
+            config_path.write_text("general:\n  project_name: ChangedProject\n")
+            changed = load_config(config_path)
+            assert changed.general.project_name == "ChangedProject"
+            assert mock_yaml.call_count == 3
+
+            # Changing QUACK_* environment variables invalidates the cache
+            with patch.dict(os.environ, {"QUACK_GENERAL__PROJECT_NAME": "EnvProject"}):
+                env_config = load_config(config_path)
+                assert env_config.general.project_name == "EnvProject"
+            assert load_config(config_path) == changed
+            assert mock_yaml.call_count == 4
+
+            # Clearing the cache forces a reload
+            clear_config_cache()
+            assert load_config(config_path) == changed
+            assert mock_yaml.call_count == 5
+
+        # Parsed YAML is cached but returned as an independent copy
+        loaded = load_yaml_config(config_path)
+        loaded["general"]["project_name"] = "Mutated"
+        assert load_yaml_config(config_path)["general"]["project_name"] == (
+            "ChangedProject"
+        )
+
+    def test_load_config_cache_per_directory(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that same-named files in different directories are cached apart."""
+        clear_config_cache()
+        monkeypatch.delenv("QUACK_CONFIG", raising=False)
+        for name in ("a", "b"):
+            config_path = temp_dir / name / "quack_config.yaml"
+            config_path.parent.mkdir()
+            config_path.write_text(f"general:\n  project_name: Project{name}\n")
+            # Identical mtimes, as after cp -p or in mtime-normalizing builds
+            os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+
+        for name in ("a", "b"):
+            monkeypatch.chdir(temp_dir / name)
+            assert load_config().general.project_name == f"Project{name}"
+            assert load_yaml_config("quack_config.yaml")["general"] == {
+                "project_name": f"Project{name}"
+            }
+
+    def test_load_config_watch(self, temp_dir: Path) -> None:
+        """Test that watched configuration files invalidate the cache on change."""
+        pytest.importorskip("watchdog")
+        clear_config_cache()
+        config_path = temp_dir / "watched_config.yaml"
+        config_path.write_text("general:\n  project_name: WatchedProject\n")
+
+        watched = os.path.abspath(config_path)
+
+        # Events from the real observer are discarded, so only the direct
+        # handler calls below invalidate the cache and the test cannot race
+        try:
+            with (
+                patch.dict(os.environ, {CONFIG_WATCH_ENV: "1"}),
+                patch("quackcore.config.loader._on_config_file_event"),
+            ):
+                first = load_config(config_path)
+                assert watched in _WATCHED_FILES
+
+                # Cache hits no longer stat the watched file
+                with patch.object(Path, "stat", side_effect=AssertionError):
+                    assert load_config(config_path) == first
+
+                # The loader's own reads do not count as changes
+                _on_config_file_event("opened", {watched})
+                _on_config_file_event("closed_no_write", {watched})
+                assert watched in _WATCHED_FILES
+
+                # A change reported by the watcher clears the cache
+                config_path.write_text("general:\n  project_name: Changed\n")
+                _on_config_file_event("modified", {watched})
+                assert watched not in _WATCHED_FILES
+                assert load_config(config_path).general.project_name == "Changed"
+
+                # A change during a load does not leave that load's result cached
+                def load_during_edit(path: Path) -> dict:
+                    loaded = load_yaml_config(path)
+                    config_path.write_text("general:\n  project_name: Edited\n")
+                    _on_config_file_event("modified", {watched})
+                    return loaded
+
+                config_path.write_text("general:\n  project_name: Before\n")
+                _on_config_file_event("modified", {watched})
+                with patch(
+                    "quackcore.config.loader.load_yaml_config",
+                    side_effect=load_during_edit,
+                ):
+                    assert load_config(config_path).general.project_name == "Before"
+                assert load_config(config_path).general.project_name == "Edited"
+        finally:
+            _stop_config_watchers()
+
+        # Without the opt-in flag no watcher is started
+        load_config(config_path)
+        assert watched not in _WATCHED_FILES
+
+    def test_load_config_lazy(self, temp_dir: Path) -> None:
+        """Test that lazy configuration is only loaded on first access."""
+        config_path = temp_dir / "lazy_config.yaml"
+        config_path.write_text("general:\n  project_name: LazyProject\n")
+
+        with patch(
+            "quackcore.config.loader.load_config", wraps=load_config
+        ) as mock_load:
+            lazy = load_config_lazy(config_path, merge_env=False)
+            assert isinstance(lazy, LazyQuackConfig)
+            assert not lazy.is_loaded
+            mock_load.assert_not_called()
+
+            # First access loads the configuration, later ones reuse it
+            assert lazy.general.project_name == "LazyProject"
+            assert lazy.get_plugin_enabled("any_plugin") is True
+            assert lazy.is_loaded
+            mock_load.assert_called_once_with(config_path, False, True)
+            assert isinstance(lazy.materialize(), QuackConfig)
+
+            # Assignments are forwarded to the loaded configuration
+            lazy.general = GeneralConfig(project_name="Assigned")
+            assert lazy.materialize().general.project_name == "Assigned"
+            mock_load.assert_called_once()
+
+        # Loading errors surface on first use
+        missing = load_config_lazy(temp_dir / "missing.yaml")
+        with pytest.raises(QuackConfigurationError):
+            _ = missing.general
+
     def test_merge_configs(self, sample_config: QuackConfig) -> None:
         """Test merging configurations."""
         # Create an override dictionary
@@ -3,6 +3,7 @@
 Tests for filesystem utility functions.
 """
 
+import errno
 import os
 import platform
 import tempfile
@@ -46,6 +47,7 @@ from quackcore.fs.utils import (
     safe_move,
     split_path,
 )
+from quackcore.fs.utils.safe_ops import _fast_copy2, _parallel_copytree
 
 
 class TestPathUtilities:
@@ -557,6 +559,130 @@ class TestFileUtilities:
         assert (dst_dir / "file.txt").exists()
         assert (dst_dir / "file.txt").read_text() == "dir file content"
 
+        # Test overwriting a directory copies into the existing destination
+        (src_dir / "file.txt").write_text("updated dir file content")
+        (dst_dir / "extra.txt").write_text("only in destination")
+        result = safe_copy(src_dir, dst_dir, overwrite=True)
+        assert result == dst_dir
+        assert (dst_dir / "file.txt").read_text() == "updated dir file content"
+        assert (dst_dir / "extra.txt").exists()
+
+    def test_safe_copy_parallel(self, temp_dir: Path) -> None:
+        """Test copying directory trees on a thread pool."""
+        src_dir = temp_dir / "parallel_src"
+        (src_dir / "nested" / "deeper").mkdir(parents=True)
+        (src_dir / "empty").mkdir()
+        (src_dir / "top.txt").write_text("top")
+        (src_dir / "nested" / "mid.txt").write_text("mid")
+        (src_dir / "nested" / "deeper" / "leaf.txt").write_text("leaf")
+
+        # Test an explicit parallel copy reproduces the tree
+        dst_dir = temp_dir / "parallel_dst"
+        result = safe_copy(src_dir, dst_dir, parallel=True)
+        assert result == dst_dir
+        assert (dst_dir / "empty").is_dir()
+        assert (dst_dir / "top.txt").read_text() == "top"
+        assert (dst_dir / "nested" / "mid.txt").read_text() == "mid"
+        assert (dst_dir / "nested" / "deeper" / "leaf.txt").read_text() == "leaf"
+
+        # Test existing destinations still require overwrite
+        with pytest.raises(QuackFileExistsError):
+            safe_copy(src_dir, dst_dir, parallel=True)
+        (src_dir / "top.txt").write_text("updated top")
+        safe_copy(src_dir, dst_dir, overwrite=True, parallel=True)
+        assert (dst_dir / "top.txt").read_text() == "updated top"
+
+        # Test large directories are copied in parallel by default
+        for i in range(40):
+            (src_dir / f"file_{i}.txt").write_text(str(i))
+        with patch(
+            "quackcore.fs.utils.safe_ops._parallel_copytree",
+            wraps=_parallel_copytree,
+        ) as mock_parallel:
+            safe_copy(src_dir, temp_dir / "auto_dst")
+            mock_parallel.assert_called_once()
+        assert (temp_dir / "auto_dst" / "file_39.txt").read_text() == "39"
+
+        # Test small directories use a sequential copy by default
+        with patch("quackcore.fs.utils.safe_ops._parallel_copytree") as mock_parallel:
+            safe_copy(src_dir / "nested", temp_dir / "small_dst")
+            mock_parallel.assert_not_called()
+
+    def test_safe_copy_parallel_unreadable_directory(self, temp_dir: Path) -> None:
+        """Test that a directory that cannot be listed fails a parallel copy."""
+        src_dir = temp_dir / "locked_src"
+        (src_dir / "locked").mkdir(parents=True)
+        (src_dir / "locked" / "hidden.txt").write_text("hidden")
+        (src_dir / "open.txt").write_text("open")
+        locked = str(src_dir / "locked")
+        real_scandir = os.scandir
+
+        # Simulated, since permission bits do not restrict root
+        def scandir(path: str = ".") -> object:
+            if os.fspath(path) == locked:
+                raise PermissionError(errno.EACCES, "Permission denied", locked)
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=scandir):
+            with pytest.raises(QuackIOError) as excinfo:
+                safe_copy(src_dir, temp_dir / "locked_dst", parallel=True)
+        assert locked in str(excinfo.value)
+
+        # The readable files are still copied
+        assert (temp_dir / "locked_dst" / "open.txt").read_text() == "open"
+
+    def test_fast_copy2(self, temp_dir: Path) -> None:
+        """Test copying files through the kernel copy fast path and fallbacks."""
+        src_path = temp_dir / "fast_src.bin"
+        src_path.write_bytes(b"fast copy content" * 1024)
+        os.utime(src_path, (1_000_000_000, 1_000_000_000))
+
+        # Test copying preserves content and metadata
+        dst_path = temp_dir / "fast_dst.bin"
+        assert _fast_copy2(str(src_path), str(dst_path)) == str(dst_path)
+        assert dst_path.read_bytes() == src_path.read_bytes()
+        assert dst_path.stat().st_mtime == src_path.stat().st_mtime
+
+        # Test copying into a directory keeps the file name
+        target_dir = temp_dir / "fast_dir"
+        target_dir.mkdir()
+        result = _fast_copy2(str(src_path), str(target_dir))
+        assert result == str(target_dir / "fast_src.bin")
+        assert (target_dir / "fast_src.bin").read_bytes() == src_path.read_bytes()
+
+        # Test falling back to shutil.copy2 when kernel copies are unsupported
+        fallback_path = temp_dir / "fallback_dst.bin"
+        with patch(
+            "quackcore.fs.utils.safe_ops._copy_file_contents",
+            side_effect=OSError("unsupported"),
+        ):
+            _fast_copy2(str(src_path), str(fallback_path))
+        assert fallback_path.read_bytes() == src_path.read_bytes()
+
+        # Test short kernel copies continue until end of file
+        if hasattr(os, "copy_file_range"):
+            real_copy_file_range = os.copy_file_range
+            short_path = temp_dir / "short_dst.bin"
+            with (
+                patch("quackcore.fs.utils.safe_ops.fcntl", None),
+                patch(
+                    "os.copy_file_range",
+                    side_effect=lambda src, dst, count: real_copy_file_range(
+                        src, dst, min(count, 1000)
+                    ),
+                ) as mock_copy,
+            ):
+                _fast_copy2(str(src_path), str(short_path))
+            assert short_path.read_bytes() == src_path.read_bytes()
+            assert mock_copy.call_count > 1
+
+        # Test files reporting size 0, such as procfs files, keep their content
+        proc_path = Path("/proc/self/status")
+        if proc_path.exists():
+            proc_copy = temp_dir / "status.txt"
+            _fast_copy2(str(proc_path), str(proc_copy))
+            assert proc_copy.read_text().startswith("Name:")
+
     def test_safe_move(self, temp_dir: Path) -> None:
         """Test safe file moving."""
         # Create a source file
@@ -601,6 +727,27 @@ class TestFileUtilities:
         assert (dst_dir / "file.txt").exists()
         assert (dst_dir / "file.txt").read_text() == "dir file content for move"
 
+        # Test moving a directory over an existing directory with overwrite
+        src_dir.mkdir()
+        (src_dir / "new.txt").write_text("replacement content")
+        result = safe_move(src_dir, dst_dir, overwrite=True)
+        assert result == dst_dir
+        assert not src_dir.exists()
+        assert (dst_dir / "new.txt").read_text() == "replacement content"
+        assert not (dst_dir / "file.txt").exists()
+
+        # Test falling back to shutil.move across filesystems
+        src_path.write_text("cross device content")
+        cross_dst = temp_dir / "cross_device_dst.txt"
+        with patch(
+            "quackcore.fs.utils.safe_ops.os.rename",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            with patch("quackcore.fs.utils.safe_ops.shutil.move") as mock_move:
+                result = safe_move(src_path, cross_dst)
+        assert result == cross_dst
+        mock_move.assert_called_once_with(str(src_path), str(cross_dst))
+
     def test_safe_delete(self, temp_dir: Path) -> None:
         """Test safe file deletion."""
         # Create a file to delete
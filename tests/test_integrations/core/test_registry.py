@@ -3,9 +3,12 @@
 Tests for the integration registry module.
 """
 
+import sys
+
 import pytest
 
 from quackcore.errors import QuackError
+from quackcore.integrations.core.protocols import IntegrationProtocol
 from quackcore.integrations.core.registry import IntegrationRegistry
 from quackcore.integrations.core.results import IntegrationResult
 
@@ -57,7 +60,7 @@ def test_registry_creation(registry):
     """Test that the registry can be created."""
     assert registry is not None
     assert isinstance(registry, IntegrationRegistry)
-    assert registry.list_integrations() == []
+    assert registry.list_integrations() == ()
 
 
 def test_register_integration(registry, mock_integration):
@@ -67,7 +70,9 @@ def test_register_integration(registry, mock_integration):
 
     # Verify it's registered
     assert registry.is_registered(mock_integration.name)
-    assert registry.list_integrations() == [mock_integration.name]
+    assert registry.list_integrations() == (mock_integration.name,)
+    # The names snapshot is reused until the registry changes
+    assert registry.list_integrations() is registry.list_integrations()
     assert registry.get_integration(mock_integration.name) is mock_integration
 
 
@@ -83,6 +88,11 @@ def test_register_duplicate_integration(registry, mock_integration):
     # Verify the error message
     assert "already registered" in str(excinfo.value)
 
+    # A different integration with the same name does not replace the original
+    with pytest.raises(QuackError):
+        registry.register(MockIntegration(mock_integration.name))
+    assert registry.get_integration(mock_integration.name) is mock_integration
+
 
 def test_unregister_integration(registry, mock_integration):
     """Test unregistering an integration."""
@@ -93,7 +103,7 @@ def test_unregister_integration(registry, mock_integration):
     # Verify it's unregistered
     assert result is True
     assert not registry.is_registered(mock_integration.name)
-    assert registry.list_integrations() == []
+    assert registry.list_integrations() == ()
     assert registry.get_integration(mock_integration.name) is None
 
 
@@ -117,13 +127,32 @@ def test_get_integration_by_type(registry):
     registry.register(integration2)
 
     # Get integrations by type
-    integrations = list(registry.get_integration_by_type(MockIntegration))
+    integrations = registry.get_integration_by_type(MockIntegration)
 
     # Verify the result
     assert len(integrations) == 2
     assert integration1 in integrations
     assert integration2 in integrations
 
+    # Base classes and protocols match too; unrelated types do not
+    class SubIntegration(MockIntegration):
+        pass
+
+    integration3 = SubIntegration("Integration3")
+    registry.register(integration3)
+    assert registry.get_integration_by_type(SubIntegration) == (integration3,)
+    assert len(registry.get_integration_by_type(MockIntegration)) == 3
+    assert len(registry.get_integration_by_type(IntegrationProtocol)) == 3
+    assert registry.get_integration_by_type(IntegrationResult) == ()
+
+    # Unregistered integrations are removed from the type index
+    registry.unregister("Integration3")
+    assert registry.get_integration_by_type(SubIntegration) == ()
+    assert registry.get_integration_by_type(MockIntegration) == (
+        integration1,
+        integration2,
+    )
+
 
 def test_load_integration_module(registry, monkeypatch):
     """Test loading integrations from a module."""
@@ -151,3 +180,41 @@ def test_load_integration_module(registry, monkeypatch):
     assert len(loaded) == 1
     assert loaded[0].name == "ModuleIntegration"
     assert registry.is_registered("ModuleIntegration")
+
+
+def test_register_many(registry, mock_integration):
+    """Test registering several integrations at once."""
+    integration1 = MockIntegration("Integration1")
+    integration2 = MockIntegration("Integration2")
+
+    registry.register_many([integration1, integration2])
+    assert registry.list_integrations() == ("Integration1", "Integration2")
+    assert registry.get_integration_by_type(MockIntegration) == (
+        integration1,
+        integration2,
+    )
+
+    # An empty batch is a no-op and keeps the cached names
+    names = registry.list_integrations()
+    registry.register_many([])
+    assert registry.list_integrations() is names
+
+    # A collision, with the registry or within the batch, registers nothing
+    with pytest.raises(QuackError) as excinfo:
+        registry.register_many([mock_integration, MockIntegration("Integration1")])
+    assert "Integration1" in str(excinfo.value)
+    with pytest.raises(QuackError):
+        registry.register_many(
+            [mock_integration, MockIntegration(mock_integration.name)]
+        )
+    assert not registry.is_registered(mock_integration.name)
+
+
+def test_registered_names_are_interned(registry):
+    """Test that registered names are stored interned."""
+    name = "".join(["Interned", "Integration"])
+    registry.register(MockIntegration(name))
+    registry.register_many([MockIntegration("".join(["Batch", "Integration"]))])
+
+    for stored in registry.list_integrations():
+        assert stored is sys.intern(stored)
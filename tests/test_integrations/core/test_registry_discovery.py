@@ -8,7 +8,9 @@ including entry point discovery and dynamic loading.
 
 import os
 import sys
-from importlib.metadata import EntryPoint
+from abc import ABCMeta
+from importlib.metadata import EntryPoint, EntryPoints
+from types import ModuleType
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,9 +18,14 @@ import pytest
 from quackcore.errors import QuackError
 from quackcore.integrations.core.protocols import IntegrationProtocol
 from quackcore.integrations.core.registry import (
+    _PROTO_CACHE,
     IntegrationRegistry,
     PluginLoaderProtocol,
+    _is_integration,
+    _LazyIntegration,
+    refresh_entry_points,
 )
+from quackcore.integrations.core.results import IntegrationResult
 
 
 class MockIntegration:
@@ -118,6 +125,20 @@ class TestIntegrationRegistryDiscovery:
                 assert registry.is_registered("Integration1")
                 assert registry.is_registered("Integration2")
 
+                # Registered entry points are skipped on repeated discovery
+                with patch.object(
+                    registry, "_load_integration_from_entry"
+                ) as mock_load:
+                    assert registry.discover_integrations() == []
+                    mock_load.assert_not_called()
+
+                # Unregistered integrations are discovered again
+                registry.unregister("Integration1")
+                discovered = registry.discover_integrations()
+                assert [integration.name for integration in discovered] == [
+                    "Integration1"
+                ]
+
         # Test discovery with plugin loader
         mock_plugin_loader = MockPluginLoader(
             {
@@ -169,23 +190,80 @@ class TestIntegrationRegistryDiscovery:
                 assert registry.is_registered("Integration1")
                 assert not registry.is_registered("bad_entry")
 
+    def test_discover_integrations_lazy(self, registry):
+        """Test that lazy discovery defers loading until first use."""
+        factory = MagicMock(side_effect=lambda: MockIntegration("Integration1"))
+        entry = MockEntryPoint(
+            "integration1", "quackcore.integrations.integration1", factory
+        )
+        bad_entry = MockEntryPoint("bad_entry", "quackcore.integrations.bad_entry")
+
+        with (
+            patch(
+                "quackcore.integrations.core.registry.IntegrationRegistry._get_entry_points",
+                return_value=[entry, bad_entry],
+            ),
+            patch(
+                "quackcore.integrations.core.registry.IntegrationRegistry._get_plugin_loader",
+                return_value=None,
+            ),
+        ):
+            discovered = registry.discover_integrations(lazy=True)
+
+        # Proxies are registered under the entry point names without loading
+        assert len(discovered) == 2
+        assert registry.list_integrations() == ("integration1", "bad_entry")
+        proxy = registry.get_integration("integration1")
+        assert isinstance(proxy, _LazyIntegration)
+        assert not proxy.is_loaded
+        assert "not loaded" in repr(proxy)
+        factory.assert_not_called()
+
+        # The first use loads the integration once and delegates to it
+        assert proxy.is_available() is False
+        assert proxy.initialize()["success"] is True
+        assert proxy.is_available() is True
+        assert proxy.version == "1.0.0"
+        assert proxy.materialize().name == "Integration1"
+        assert proxy.is_loaded
+        factory.assert_called_once()
+
+        # Entries that fail to load report an error instead of raising
+        bad_proxy = registry.get_integration("bad_entry")
+        assert bad_proxy.is_available() is False
+        result = bad_proxy.initialize()
+        assert not result.success
+        assert "could not be loaded" in result.error
+        with pytest.raises(QuackError):
+            bad_proxy.materialize()
+
     def test_get_entry_points(self, registry):
         """Test retrieving entry points."""
         # Mock entry_points function
-        mock_eps = [
-            EntryPoint(
-                name="integration1",
-                value="quackcore.integrations.integration1",
-                group="quackcore.integrations",
-            ),
-            EntryPoint(
-                name="integration2",
-                value="quackcore.integrations.integration2",
-                group="quackcore.integrations",
-            ),
-        ]
+        mock_eps = EntryPoints(
+            [
+                EntryPoint(
+                    name="integration1",
+                    value="quackcore.integrations.integration1",
+                    group="quackcore.integrations",
+                ),
+                EntryPoint(
+                    name="integration2",
+                    value="quackcore.integrations.integration2",
+                    group="quackcore.integrations",
+                ),
+                EntryPoint(
+                    name="other",
+                    value="other.module",
+                    group="other.group",
+                ),
+            ]
+        )
 
-        with patch("importlib.metadata.entry_points") as mock_entry_points:
+        refresh_entry_points()
+        with patch(
+            "quackcore.integrations.core.registry._entry_points"
+        ) as mock_entry_points:
             mock_entry_points.return_value = mock_eps
 
             entry_points = registry._get_entry_points("quackcore.integrations")
@@ -193,12 +271,28 @@ class TestIntegrationRegistryDiscovery:
             assert entry_points[0].name == "integration1"
             assert entry_points[1].name == "integration2"
 
+            # Repeated lookups are served from the cache
+            other_registry = IntegrationRegistry()
+            assert registry._get_entry_points("quackcore.integrations") == entry_points
+            assert other_registry._get_entry_points("quackcore.integrations") == (
+                entry_points
+            )
+            assert [ep.name for ep in registry._get_entry_points("other.group")] == [
+                "other"
+            ]
+            # A single unfiltered scan serves every group
+            mock_entry_points.assert_called_once_with()
+
         # Test with exception
-        with patch("importlib.metadata.entry_points") as mock_entry_points:
+        refresh_entry_points()
+        with patch(
+            "quackcore.integrations.core.registry._entry_points"
+        ) as mock_entry_points:
             mock_entry_points.side_effect = Exception("Entry points error")
 
             entry_points = registry._get_entry_points("quackcore.integrations")
             assert entry_points == []
+        refresh_entry_points()
 
     def test_get_plugin_loader(self, registry):
         """Test retrieving the plugin loader."""
@@ -214,14 +308,24 @@ class TestIntegrationRegistryDiscovery:
             loader = registry._get_plugin_loader()
             assert loader is mock_loader
 
-        # Test with ImportError - completely patch sys and importlib to ensure isolation
-        with patch.object(sys, "modules", {}):  # Empty modules dict
-            with patch(
-                "importlib.import_module", side_effect=ImportError("Module not found")
-            ):
+        # The result is cached until invalidated
+        assert registry._get_plugin_loader() is mock_loader
+        registry.invalidate_plugin_loader_cache()
+
+        # Test with ImportError - completely patch sys and importlib to ensure isolation.
+        # importlib is patched first, while it can still be found in sys.modules.
+        with patch(
+            "importlib.import_module", side_effect=ImportError("Module not found")
+        ) as mock_import:
+            with patch.object(sys, "modules", {}):  # Empty modules dict
                 loader = registry._get_plugin_loader()
                 assert loader is None
 
+                # A missing loader is cached as well
+                assert registry._get_plugin_loader() is None
+                mock_import.assert_called_once()
+        registry.invalidate_plugin_loader_cache()
+
     def test_load_integration_module(self, registry):
         """Test loading integrations from a module."""
         # Test with plugin loader
@@ -316,6 +420,13 @@ class TestIntegrationRegistryDiscovery:
 
                 assert "Failed to import module" in str(excinfo.value)
 
+                # Errors raised while the module runs are wrapped as well
+                mock_import.side_effect = RuntimeError("Module body failed")
+                with pytest.raises(QuackError) as excinfo:
+                    registry.load_integration_module("broken.module")
+
+                assert "Error accessing module" in str(excinfo.value)
+
         # Test with no integrations found
         registry = IntegrationRegistry()  # Create fresh registry
 
@@ -331,3 +442,94 @@ class TestIntegrationRegistryDiscovery:
 
                 loaded = registry.load_integration_module("empty.module")
                 assert len(loaded) == 0
+
+        # Test with a module that opts out of the class scan
+        registry = IntegrationRegistry()  # Create fresh registry
+
+        class MockNoScanModule:
+            __name__ = "test.no_scan_module"
+            __quackcore_no_scan__ = True
+            TestIntegration = TestIntegrationClass
+
+        with patch(
+            "quackcore.integrations.core.registry.IntegrationRegistry._get_plugin_loader",
+            return_value=None,
+        ):
+            with (
+                patch("importlib.import_module", return_value=MockNoScanModule()),
+                patch.object(registry, "_load_integrations_from_module") as mock_scan,
+            ):
+                loaded = registry.load_integration_module("test.no_scan_module")
+                assert loaded == []
+                mock_scan.assert_not_called()
+
+    def test_load_integrations_from_module(self, registry):
+        """Test scanning a module for integration classes."""
+        module = ModuleType("test.scan_module")
+
+        class ScannedIntegration(MockIntegration):
+            def __init__(self):
+                super().__init__("ScannedIntegration")
+
+        class MetaIntegration(MockIntegration, metaclass=ABCMeta):
+            def __init__(self):
+                super().__init__("MetaIntegration")
+
+        # Name and version set in __init__ are found after instantiation
+        class InstanceAttrIntegration:
+            def __init__(self):
+                self.name = "InstanceAttrIntegration"
+                self.version = "1.0.0"
+
+            def initialize(self):
+                return IntegrationResult.success_result()
+
+            def is_available(self):
+                return True
+
+        class Helper:
+            def __init__(self):
+                raise AssertionError("non-integration classes are not instantiated")
+
+        scanned = (ScannedIntegration, MetaIntegration, InstanceAttrIntegration)
+        for cls in (*scanned, Helper):
+            cls.__module__ = module.__name__
+        module.ScannedIntegration = ScannedIntegration
+        module.MetaIntegration = MetaIntegration
+        module.InstanceAttrIntegration = InstanceAttrIntegration
+        module.Helper = Helper
+        module._PrivateIntegration = ScannedIntegration
+        # Classes imported from elsewhere are ignored
+        module.MockIntegration = MockIntegration
+        # Lazy module attributes (PEP 562) are not bound and not scanned
+        module.__getattr__ = lambda name: ScannedIntegration
+
+        integrations = registry._load_integrations_from_module(module)
+        assert [integration.name for integration in integrations] == [
+            "ScannedIntegration",
+            "MetaIntegration",
+            "InstanceAttrIntegration",
+        ]
+
+    def test_is_integration(self):
+        """Test the cached integration duck-type check."""
+        assert _is_integration(MockIntegration())
+        assert _PROTO_CACHE[MockIntegration] is True
+        assert _is_integration(MockIntegration("Other"))
+
+        # Attributes set on the instance are still accepted
+        class InstanceIntegration:
+            def __init__(self):
+                self.name = "InstanceIntegration"
+                self.version = "1.0.0"
+                self.initialize = lambda: {"success": True}
+                self.is_available = lambda: True
+
+        assert _is_integration(InstanceIntegration())
+        assert _PROTO_CACHE[InstanceIntegration] is False
+
+        class NotCallable(MockIntegration):
+            initialize = None
+
+        assert not _is_integration(NotCallable())
+        assert not _is_integration(object())
@@ -0,0 +1,96 @@
+# tests/test_integrations/llms/conftest.py
+"""
+Shared fixtures for the LLM integration tests.
+
+The stubs here are not autouse; test classes opt in with
+pytest.mark.usefixtures, so they also apply where a class is re-imported
+into another module such as test_llms.py.
+"""
+
+from collections.abc import Generator
+from types import SimpleNamespace
+from typing import Final
+from unittest.mock import Mock, patch
+
+import pytest
+
+from quackcore.fs import DataResult
+from quackcore.integrations.llms import registry as llm_registry
+from quackcore.integrations.llms import service as llm_service_module
+from quackcore.integrations.llms.models import ChatMessage, RoleType
+from tests.test_integrations.llms.mocks.clients import MockClient
+
+# Canonical LLM configuration served by the stubbed config file; never mutated
+OPENAI_CFG: Final = {
+    "default_provider": "openai",
+    "timeout": 60,
+    "openai": {"api_key": "test-key"},
+}
+
+# check_llm_dependencies result recorded in an environment with OpenAI installed
+RECORDED_DEPENDENCIES: Final = (True, "Available LLM providers: openai", ["openai"])
+
+
+@pytest.fixture(scope="module")
+def _stub_fs() -> Generator[None]:
+    """Stub the fs lookups of the LLM config file for the whole module."""
+    with (
+        patch("quackcore.fs.service.get_file_info") as mock_file_info,
+        patch("quackcore.fs.service.read_yaml") as mock_read_yaml,
+    ):
+        # Only these attributes are read from the file info, so a plain
+        # namespace stands in for FileInfoResult
+        mock_file_info.return_value = SimpleNamespace(
+            success=True, exists=True, is_file=True
+        )
+        mock_read_yaml.return_value = DataResult(
+            success=True,
+            path="./config/llm_config.yaml",
+            data=OPENAI_CFG,
+            format="yaml",
+        )
+        yield
+
+
+@pytest.fixture
+def _replay_dependency_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replay a recorded dependency check instead of probing for providers."""
+    monkeypatch.setattr(
+        llm_service_module, "check_llm_dependencies", lambda: RECORDED_DEPENDENCIES
+    )
+
+
+@pytest.fixture
+def get_llm_client_stub(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stub the LLM client factory so no test builds a real client."""
+    stub = Mock(spec=llm_registry.get_llm_client)
+    monkeypatch.setattr(llm_registry, "get_llm_client", stub)
+    return stub
+
+
+@pytest.fixture(scope="session")
+def chat_client() -> MockClient:
+    """Create a mock client that answers every chat with a fixed response."""
+    return MockClient(responses=["Test response"])
+
+
+@pytest.fixture(scope="session")
+def token_client() -> MockClient:
+    """Create a mock client that reports a fixed token count."""
+    return MockClient(token_counts=[42])
+
+
+@pytest.fixture(scope="session")
+def user_msg_list() -> list[ChatMessage]:
+    """Create the single user message sent by the chat and token tests."""
+    return [ChatMessage(role=RoleType.USER, content="Test message")]
+
+
+@pytest.fixture
+def _reset_mock_clients(
+    chat_client: MockClient, token_client: MockClient
+) -> Generator[None]:
+    """Reset the shared mock clients after each test."""
+    yield
+    chat_client.reset()
+    token_client.reset()
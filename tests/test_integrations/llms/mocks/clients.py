@@ -48,6 +48,20 @@ class MockClient(LLMClient):
         self.last_options = None
         self.last_callback = None
 
+    def reset(self) -> None:
+        """
+        Reset the call counters and recorded arguments.
+
+        The configured responses, token counts and errors are kept, so a
+        reset client replays them from the start.
+        """
+        self.chat_call_count = 0
+        self.count_tokens_call_count = 0
+
+        self.last_messages = None
+        self.last_options = None
+        self.last_callback = None
+
     def _chat_with_provider(
         self,
         messages: List[ChatMessage],
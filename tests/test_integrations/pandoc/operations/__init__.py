@@ -6,16 +6,22 @@ This package contains test modules for the various operation functions
 for the Pandoc integration, including HTML to Markdown and Markdown to DOCX conversion.
 """
 
-from tests.test_integrations.pandoc.operations.test_html_to_md import (
-    TestHtmlToMarkdownOperations,
-)
-from tests.test_integrations.pandoc.operations.test_md_to_docx import (
-    TestMarkdownToDocxOperations,
-)
-from tests.test_integrations.pandoc.operations.test_utils import TestPandocUtilities
+import importlib
 
-__all__ = [
-    "TestHtmlToMarkdownOperations",
-    "TestMarkdownToDocxOperations",
-    "TestPandocUtilities",
-]
+# Test classes importable from this package, loaded on first access so that
+# importing the package does not import the test modules.
+_LAZY = {
+    "TestHtmlToMarkdownOperations": ".test_html_to_md",
+    "TestMarkdownToDocxOperations": ".test_md_to_docx",
+    "TestPandocUtilities": ".test_utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> object:
+    """Import a test class from its module on first access."""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")